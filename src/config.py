@@ -1,5 +1,6 @@
 """Central configuration for the job search pipeline."""
 
+import functools
 import json
 import os
 from pathlib import Path
@@ -675,8 +676,12 @@ RECOMMENDER_WEIGHTS = {
 }
 
 # ── Institution Rankings (load) ────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
 def load_rankings() -> dict:
-    """Load institution rankings from JSON file."""
+    """Load institution rankings from JSON file (parsed once per process).
+
+    The returned dict is shared between callers -- treat it as read-only.
+    """
     if RANKINGS_PATH.exists():
         with open(RANKINGS_PATH) as f:
             return json.load(f)
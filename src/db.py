@@ -6,6 +6,7 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from datetime import datetime
+from itertools import chain
 from typing import Optional
 
 from src.config import DB_PATH
@@ -122,7 +123,13 @@ CREATE INDEX IF NOT EXISTS idx_pis_is_seed ON pis(is_seed);
 -- Composite indexes matching common query patterns
 CREATE INDEX IF NOT EXISTS idx_jobs_status_discovered ON jobs(status, discovered_at);
 CREATE INDEX IF NOT EXISTS idx_jobs_region_tier_hindex ON jobs(region ASC, tier ASC, h_index DESC);
-CREATE INDEX IF NOT EXISTS idx_jobs_discovered_at ON jobs(discovered_at);
+-- Covering indexes for the weekly trend GROUP BYs in the email report; their
+-- discovered_at prefix also serves plain date-range scans, so the old
+-- single-column index is redundant and dropped from existing databases
+CREATE INDEX IF NOT EXISTS idx_jobs_discovered_field ON jobs(discovered_at, field);
+CREATE INDEX IF NOT EXISTS idx_jobs_discovered_country ON jobs(discovered_at, country);
+DROP INDEX IF EXISTS idx_jobs_discovered_at;
+CREATE INDEX IF NOT EXISTS idx_pis_created_at ON pis(created_at);
 CREATE INDEX IF NOT EXISTS idx_pis_name_institute ON pis(name, institute);
 CREATE INDEX IF NOT EXISTS idx_pis_recommended_score ON pis(is_recommended, recommendation_score DESC);
 CREATE INDEX IF NOT EXISTS idx_pis_seed_score ON pis(is_seed, recommendation_score DESC);
@@ -153,6 +160,10 @@ _MIGRATIONS = [
     ("jobs", "info_urls", "TEXT"),
     ("jobs", "exported_at", "TEXT"),
     ("jobs", "application_materials", "TEXT"),
+    ("pis", "last_try_scholar", "TEXT"),
+    ("pis", "last_try_lab", "TEXT"),
+    ("pis", "last_try_s2", "TEXT"),
+    ("pis", "last_try_dept", "TEXT"),
 ]
 
 
@@ -271,6 +282,54 @@ def upsert_job(job: dict) -> tuple[int, bool]:
         return cursor.lastrowid, True
 
 
+# Conservative bound on bound parameters per statement (pre-3.32 default)
+_SQL_VARIABLE_LIMIT = 999
+
+# UPDATE ... FROM needs SQLite 3.33+; older builds use correlated subqueries
+_HAS_UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+
+
+def update_jobs_by_url(
+    conn: sqlite3.Connection,
+    assignments: dict[str, str],
+    columns: tuple[str, ...],
+    rows: list[tuple],
+    where: str = "",
+) -> None:
+    """Apply per-URL updates as chunked ``UPDATE jobs ... FROM (VALUES ...)``.
+
+    Each row is ``(*columns, url)``.  *assignments* maps a jobs column to
+    its new value's SQL expression; those expressions and the optional
+    extra *where* condition refer to the row values as ``v.<column>``.
+    Sends one statement per ~999 bound parameters instead of one per row.
+    Each URL is updated at most once, from its last row; earlier rows for
+    the same URL are ignored.  On SQLite older than 3.33 every expression
+    becomes a correlated subquery on ``v`` instead of ``UPDATE ... FROM``.
+    """
+    rows = list({row[-1]: row for row in rows}.values())
+    cols = (*columns, "url")
+    if _HAS_UPDATE_FROM:
+        set_clause = ", ".join(f"{col} = {expr}" for col, expr in assignments.items())
+        tail = "FROM v WHERE jobs.url = v.url" + (f" AND {where}" if where else "")
+    else:
+        set_clause = ", ".join(
+            f"{col} = (SELECT {expr} FROM v WHERE v.url = jobs.url)"
+            for col, expr in assignments.items()
+        )
+        tail = "WHERE url IN (SELECT url FROM v)"
+        if where:
+            tail += f" AND EXISTS (SELECT 1 FROM v WHERE v.url = jobs.url AND {where})"
+    row_sql = "(" + ", ".join("?" for _ in cols) + ")"
+    chunk = _SQL_VARIABLE_LIMIT // len(cols)
+    for start in range(0, len(rows), chunk):
+        batch = rows[start:start + chunk]
+        conn.execute(
+            f"WITH v({', '.join(cols)}) AS (VALUES {', '.join([row_sql] * len(batch))}) "
+            f"UPDATE jobs SET {set_clause} {tail}",
+            tuple(chain.from_iterable(batch)),
+        )
+
+
 def get_jobs(
     region: Optional[str] = None,
     status: Optional[str] = None,
@@ -313,8 +372,12 @@ def get_new_jobs_since(since: str) -> list[dict]:
 
 
 def upsert_pi(pi: dict) -> tuple[int, bool]:
-    """Insert or update a PI. Returns (pi_id, is_new)."""
-    with get_connection() as conn:
+    """Insert or update a PI. Returns (pi_id, is_new).
+
+    Thread-safe: the lookup and the write happen under ``_DB_LOCK``, so
+    concurrent discovery phases can't both insert the same (name, institute).
+    """
+    with _DB_LOCK, get_connection() as conn:
         existing = conn.execute(
             "SELECT id FROM pis WHERE name = ? AND institute = ?",
             (pi.get("name"), pi.get("institute")),
@@ -346,6 +409,33 @@ def upsert_pi(pi: dict) -> tuple[int, bool]:
         return cursor.lastrowid, True
 
 
+def upsert_pis_bulk(records: list[dict]) -> int:
+    """Insert or update many PIs in one transaction. Returns the row count.
+
+    Same merge rule as :func:`upsert_pi` -- ``None`` never overwrites an
+    existing value -- but as a single ``executemany`` of
+    ``INSERT ... ON CONFLICT(name, institute) DO UPDATE``.  Thread-safe.
+    """
+    if not records:
+        return 0
+    cols = ["name", "institute"]
+    for rec in records:
+        cols.extend(k for k in rec if k not in cols)
+    updates = [c for c in cols if c not in ("name", "institute")]
+    if updates:
+        set_clause = ", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in updates)
+        conflict = f"DO UPDATE SET {set_clause}, updated_at = datetime('now')"
+    else:
+        conflict = "DO NOTHING"
+    sql = (
+        f"INSERT INTO pis ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)}) "
+        f"ON CONFLICT(name, institute) {conflict}"
+    )
+    with _DB_LOCK, get_connection() as conn:
+        conn.executemany(sql, [tuple(rec.get(c) for c in cols) for rec in records])
+    return len(records)
+
+
 def get_seed_pis() -> list[dict]:
     """Get all seed PIs."""
     with get_connection() as conn:
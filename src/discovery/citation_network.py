@@ -16,12 +16,11 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional
 
-import requests as _req
-
 from semanticscholar import SemanticScholar
 
 from src import db
 from src.config import CV_KEYWORDS, SEMANTIC_SCHOLAR_API_KEY
+from src.discovery.http_clients import S2_SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -225,7 +224,7 @@ def _batch_get_papers(paper_ids: list[str], fields: list[str]) -> list[dict]:
     for batch_start in range(0, len(paper_ids), _BATCH_SIZE):
         batch = paper_ids[batch_start : batch_start + _BATCH_SIZE]
         try:
-            resp = _req.post(
+            resp = S2_SESSION.post(
                 "https://api.semanticscholar.org/graph/v1/paper/batch",
                 headers=headers,
                 json={"ids": batch},
@@ -237,7 +236,7 @@ def _batch_get_papers(paper_ids: list[str], fields: list[str]) -> list[dict]:
             if resp.status_code == 429:
                 logger.warning("S2 rate limited during batch fetch, sleeping 60s")
                 time.sleep(60)
-                resp = _req.post(
+                resp = S2_SESSION.post(
                     "https://api.semanticscholar.org/graph/v1/paper/batch",
                     headers=headers,
                     json={"ids": batch},
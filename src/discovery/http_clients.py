@@ -0,0 +1,37 @@
+"""Shared HTTP sessions for the discovery lookups.
+
+One keep-alive ``requests.Session`` per external host, so repeated
+Scholar / DuckDuckGo / Semantic Scholar calls reuse pooled connections
+instead of paying a TCP+TLS handshake each time.
+
+Retries cover connection errors only; HTTP status handling (429/403
+circuit breakers, rate-limit sleeps) stays with the callers.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled session with light connection-level retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status=0,
+            status_forcelist=None,
+            respect_retry_after_header=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SCHOLAR_SESSION = _build_session()  # scholar.google.com
+DDG_SESSION = _build_session()      # html.duckduckgo.com
+S2_SESSION = _build_session()       # api.semanticscholar.org
@@ -13,7 +13,8 @@ from urllib.parse import urljoin, urlparse
 import requests
 
 from src import db
-from src.discovery.web_search import ddg_search
+from src.discovery.http_clients import DDG_SESSION
+from src.discovery.web_search import ddg_blocked_count, ddg_search, note_ddg_blocked
 
 logger = logging.getLogger(__name__)
 
@@ -71,9 +72,10 @@ def _search_university_directory(
     url = f"https://html.duckduckgo.com/html/?q={requests.utils.quote(query)}"
 
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
+        resp = DDG_SESSION.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
         if resp.status_code == 403:
             logger.debug("DDG 403 for %s at %s", name, domain)
+            note_ddg_blocked()
             return None
         resp.raise_for_status()
         time.sleep(2.0)  # be polite to DDG
@@ -89,6 +91,7 @@ def _search_university_directory(
                 return real
     except Exception:
         logger.debug("Directory search failed for %s at %s", name, domain)
+        note_ddg_blocked()
 
     return None
 
@@ -301,11 +304,30 @@ def find_lab_url_for_pi(name: str, institute: Optional[str] = None) -> Optional[
     return None
 
 
+# institute -> domain, memoized per process.  Only answers DDG actually gave
+# are stored, so a lookup that hit a 403 or the breaker is retried later.
+_DOMAIN_CACHE: dict[str, Optional[str]] = {}
+
+
 def _institute_to_domain(institute: str) -> Optional[str]:
     """Best-effort mapping of institute name to web domain.
 
     Uses a small lookup table for common universities plus a heuristic.
+    Memoized per process: the fallback is a DuckDuckGo search, and the
+    same institute is resolved for many PIs and departments in one run.
     """
+    if institute in _DOMAIN_CACHE:
+        return _DOMAIN_CACHE[institute]
+
+    blocked = ddg_blocked_count()
+    domain = _resolve_institute_domain(institute)
+    if ddg_blocked_count() == blocked:
+        _DOMAIN_CACHE[institute] = domain
+    return domain
+
+
+def _resolve_institute_domain(institute: str) -> Optional[str]:
+    """Uncached body of :func:`_institute_to_domain`."""
     if not institute:
         return None
 
@@ -438,8 +460,9 @@ def _ddg_find_domain(institute: str) -> Optional[str]:
     query = f"{institute} official website"
     url = f"https://html.duckduckgo.com/html/?q={requests.utils.quote(query)}"
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
+        resp = DDG_SESSION.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
         if resp.status_code == 403:
+            note_ddg_blocked()
             return None
         resp.raise_for_status()
         time.sleep(2.0)
@@ -453,7 +476,7 @@ def _ddg_find_domain(institute: str) -> Optional[str]:
                     logger.debug("DDG domain for %s: %s", institute, domain)
                     return domain
     except Exception:
-        pass
+        note_ddg_blocked()
     return None
 
 
@@ -21,6 +21,7 @@ import requests
 
 from src import db
 from src.config import SEMANTIC_SCHOLAR_API_KEY
+from src.discovery.http_clients import S2_SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +70,7 @@ def _search_author(
             ),
             "limit": 20,
         }
-        resp = requests.get(
+        resp = S2_SESSION.get(
             f"{_S2_API_BASE}/author/search",
             params=params,
             headers=_s2_headers(),
@@ -80,7 +81,7 @@ def _search_author(
             logger.warning("S2 rate-limited searching for %s; sleeping %ds", name, _S2_RATE_LIMIT_DELAY)
             time.sleep(_S2_RATE_LIMIT_DELAY)
             # Retry once
-            resp = requests.get(
+            resp = S2_SESSION.get(
                 f"{_S2_API_BASE}/author/search",
                 params=params,
                 headers=_s2_headers(),
@@ -20,6 +20,8 @@ from urllib.parse import quote_plus, urljoin
 
 import requests
 
+from src.discovery.http_clients import SCHOLAR_SESSION
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -37,6 +39,16 @@ _gs_consecutive_failures = 0
 _gs_disabled = False
 _gs_disabled_at = 0.0
 
+# Per-thread count of searches that got no answer (breaker open, 403/429,
+# request error), so callers can tell a blocked lookup from a genuine miss.
+_gs_blocked = threading.local()
+
+
+def gs_blocked_count() -> int:
+    """Return how many Scholar searches on this thread got no usable answer."""
+    return getattr(_gs_blocked, "count", 0)
+
+
 # ---------------------------------------------------------------------------
 # User-Agent rotation
 # ---------------------------------------------------------------------------
@@ -257,6 +269,7 @@ def search_scholar_author(
                 _gs_consecutive_failures = 0
             else:
                 logger.debug("GS circuit breaker open (%.0fs remaining)", _GS_COOLDOWN - elapsed)
+                _gs_blocked.count = gs_blocked_count() + 1
                 return None
 
     # Rate limit
@@ -276,7 +289,7 @@ def search_scholar_author(
     url = f"{_GS_BASE}/citations?view_op=search_authors&mauthors={quote_plus(query)}&hl=en"
 
     try:
-        resp = requests.get(url, headers=_get_headers(), timeout=_GS_TIMEOUT)
+        resp = SCHOLAR_SESSION.get(url, headers=_get_headers(), timeout=_GS_TIMEOUT)
 
         with _gs_lock:
             _gs_last_call = time.time()
@@ -292,6 +305,7 @@ def search_scholar_author(
                         "GS circuit breaker tripped after %d failures, cooldown %ds",
                         _gs_consecutive_failures, int(_GS_COOLDOWN),
                     )
+            _gs_blocked.count = gs_blocked_count() + 1
             return None
 
         resp.raise_for_status()
@@ -335,4 +349,5 @@ def search_scholar_author(
                     "GS circuit breaker tripped after %d failures, cooldown %ds",
                     _gs_consecutive_failures, int(_GS_COOLDOWN),
                 )
+        _gs_blocked.count = gs_blocked_count() + 1
         return None
@@ -4,8 +4,10 @@ Fetches academic profiles from Semantic Scholar, builds a TF-IDF research
 vector for each seed PI, and persists everything back to the database.
 """
 
+import heapq
 import json
 import logging
+import threading
 import time
 from datetime import datetime
 from typing import Optional
@@ -16,11 +18,26 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 
 from src import db
 from src.config import SEMANTIC_SCHOLAR_API_KEY, _USER_PROFILE_PATH
+from src.discovery.http_clients import S2_SESSION
 
 logger = logging.getLogger(__name__)
 
 _S2_DELAY = 3.1  # ~100 requests per 5 min for free tier
 
+# Per-thread count of S2 requests that got no answer (429, request error),
+# so callers can tell a rate-limited lookup from a genuine miss.
+_s2_blocked = threading.local()
+
+
+def s2_blocked_count() -> int:
+    """Return how many S2 requests on this thread got no usable answer."""
+    return getattr(_s2_blocked, "count", 0)
+
+
+def _note_s2_blocked() -> None:
+    """Record an S2 request on this thread that got no usable answer."""
+    _s2_blocked.count = s2_blocked_count() + 1
+
 # ---------------------------------------------------------------------------
 # Known Semantic Scholar author IDs for famous PIs with common names.
 # The S2 search API (limit=20) often fails to return these researchers
@@ -88,8 +105,6 @@ def _disambiguate_author(
 
     Returns the best-matching authorId, or None.
     """
-    import requests as _req
-
     # Check known IDs first (handles famous PIs with common names)
     known_id = KNOWN_S2_IDS.get(name)
     if known_id:
@@ -106,7 +121,7 @@ def _disambiguate_author(
         if SEMANTIC_SCHOLAR_API_KEY:
             headers["x-api-key"] = SEMANTIC_SCHOLAR_API_KEY
 
-        resp = _req.get(
+        resp = S2_SESSION.get(
             "https://api.semanticscholar.org/graph/v1/author/search",
             params=params,
             headers=headers,
@@ -239,8 +254,6 @@ def fetch_semantic_scholar_metadata(
     Returns a dict with keys: ``h_index``, ``citations``, ``homepage``,
     ``s2_url``, ``full_name``, ``authorId``.
     """
-    import requests as _req
-
     is_single = " " not in name.strip()
 
     if is_single and not institute:
@@ -257,7 +270,7 @@ def fetch_semantic_scholar_metadata(
         if SEMANTIC_SCHOLAR_API_KEY:
             headers["x-api-key"] = SEMANTIC_SCHOLAR_API_KEY
 
-        resp = _req.get(
+        resp = S2_SESSION.get(
             "https://api.semanticscholar.org/graph/v1/author/search",
             params=params,
             headers=headers,
@@ -267,6 +280,7 @@ def fetch_semantic_scholar_metadata(
 
         if resp.status_code == 429:
             logger.debug("S2 rate limited for %s", name)
+            _note_s2_blocked()
             return None
         resp.raise_for_status()
 
@@ -302,27 +316,86 @@ def fetch_semantic_scholar_metadata(
 
         best = max(data, key=_score)
 
-        return {
-            "h_index": best.get("hIndex"),
-            "citations": best.get("citationCount"),
-            "homepage": best.get("homepage") or None,
-            "s2_url": best.get("url") or f"https://www.semanticscholar.org/author/{best['authorId']}",
-            "full_name": best.get("name"),
-            "authorId": best.get("authorId"),
-        }
+        return _s2_author_metadata(best)
     except Exception:
         logger.debug("Semantic Scholar metadata fetch failed for %s", name, exc_info=True)
+        _note_s2_blocked()
         return None
 
 
+def _s2_author_metadata(author: dict) -> dict:
+    """Map an S2 author record to the dict returned by the metadata fetchers."""
+    return {
+        "h_index": author.get("hIndex"),
+        "citations": author.get("citationCount"),
+        "homepage": author.get("homepage") or None,
+        "s2_url": author.get("url") or f"https://www.semanticscholar.org/author/{author['authorId']}",
+        "full_name": author.get("name"),
+        "authorId": author.get("authorId"),
+    }
+
+
+_S2_BATCH_SIZE = 500  # API accepts up to 1000 ids per request
+_S2_BATCH_BACKOFF = 60  # seconds to wait before retrying a rate-limited batch
+
+
+def fetch_semantic_scholar_metadata_batch(author_ids: list[str]) -> dict[str, dict]:
+    """Fetch metadata for known S2 author IDs via ``POST /author/batch``.
+
+    One request per ``_S2_BATCH_SIZE`` ids instead of one search per PI.
+    Returns ``{authorId: metadata}`` in the same shape as
+    :func:`fetch_semantic_scholar_metadata`; ids S2 doesn't know are omitted.
+    """
+    ids = list(dict.fromkeys(a for a in author_ids if a))
+    results: dict[str, dict] = {}
+    headers = {}
+    if SEMANTIC_SCHOLAR_API_KEY:
+        headers["x-api-key"] = SEMANTIC_SCHOLAR_API_KEY
+
+    def _post_batch(chunk: list[str]):
+        resp = S2_SESSION.post(
+            "https://api.semanticscholar.org/graph/v1/author/batch",
+            params={"fields": "authorId,name,hIndex,citationCount,homepage,url"},
+            json={"ids": chunk},
+            headers=headers,
+            timeout=30,
+        )
+        time.sleep(_S2_DELAY)
+        return resp
+
+    for start in range(0, len(ids), _S2_BATCH_SIZE):
+        chunk = ids[start:start + _S2_BATCH_SIZE]
+        try:
+            resp = _post_batch(chunk)
+            if resp.status_code == 429:
+                logger.warning(
+                    "S2 rate limited on author batch (%d ids), retrying in %ds",
+                    len(chunk), _S2_BATCH_BACKOFF,
+                )
+                time.sleep(_S2_BATCH_BACKOFF)
+                resp = _post_batch(chunk)
+            if resp.status_code == 429:
+                logger.warning(
+                    "S2 still rate limited, dropping author batch of %d ids", len(chunk),
+                )
+                continue
+            resp.raise_for_status()
+
+            for author in resp.json():
+                if author and author.get("authorId"):
+                    results[author["authorId"]] = _s2_author_metadata(author)
+        except Exception:
+            logger.warning("S2 author batch failed, dropping %d ids", len(chunk), exc_info=True)
+
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Paper fetching
 # ---------------------------------------------------------------------------
 
 def fetch_author_papers(author_id: str) -> Optional[list[dict]]:
     """Fetch papers for a Semantic Scholar author by authorId."""
-    import requests as _req
-
     try:
         params = {
             "fields": "title,year,citationCount,url",
@@ -332,7 +405,7 @@ def fetch_author_papers(author_id: str) -> Optional[list[dict]]:
         if SEMANTIC_SCHOLAR_API_KEY:
             headers["x-api-key"] = SEMANTIC_SCHOLAR_API_KEY
 
-        resp = _req.get(
+        resp = S2_SESSION.get(
             f"https://api.semanticscholar.org/graph/v1/author/{author_id}/papers",
             params=params,
             headers=headers,
@@ -342,6 +415,7 @@ def fetch_author_papers(author_id: str) -> Optional[list[dict]]:
 
         if resp.status_code == 429:
             logger.debug("S2 rate limited fetching papers for author %s", author_id)
+            _note_s2_blocked()
             return None
         resp.raise_for_status()
 
@@ -357,6 +431,7 @@ def fetch_author_papers(author_id: str) -> Optional[list[dict]]:
         return papers
     except Exception:
         logger.debug("S2 paper fetch failed for author %s", author_id, exc_info=True)
+        _note_s2_blocked()
         return None
 
 
@@ -364,8 +439,9 @@ def fetch_pi_papers(
     name: str,
     institute: Optional[str] = None,
     s2_author_id: Optional[str] = None,
+    limit: int = 5,
 ) -> Optional[dict]:
-    """Fetch recent and top-cited papers for a PI."""
+    """Fetch the *limit* most recent and most cited papers for a PI."""
     if not s2_author_id:
         meta = fetch_semantic_scholar_metadata(name, institute)
         if not meta or not meta.get("authorId"):
@@ -378,8 +454,8 @@ def fetch_pi_papers(
         return None
 
     with_year = [p for p in papers if p.get("year")]
-    recent = sorted(with_year, key=lambda p: p["year"], reverse=True)[:5]
-    top_cited = sorted(papers, key=lambda p: p["citation_count"], reverse=True)[:5]
+    recent = heapq.nlargest(limit, with_year, key=lambda p: p["year"])
+    top_cited = heapq.nlargest(limit, papers, key=lambda p: p["citation_count"])
 
     return {
         "recent_papers": recent,
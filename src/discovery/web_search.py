@@ -14,6 +14,8 @@ from urllib.parse import unquote
 
 import requests
 
+from src.discovery.http_clients import DDG_SESSION
+
 logger = logging.getLogger(__name__)
 
 _DDG_DELAY = 2.5  # seconds between DDG requests
@@ -33,6 +35,21 @@ _ddg_consecutive_failures = 0
 _ddg_disabled = False
 _ddg_disabled_at = 0.0  # timestamp when breaker tripped
 
+# Per-thread count of DDG requests that got no answer (breaker open, 403,
+# request error).  Callers compare it before and after a lookup to tell
+# "DDG was blocked" from "DDG found nothing".
+_ddg_blocked = threading.local()
+
+
+def ddg_blocked_count() -> int:
+    """Return how many DDG requests on this thread got no usable answer."""
+    return getattr(_ddg_blocked, "count", 0)
+
+
+def note_ddg_blocked() -> None:
+    """Record a DDG request on this thread that got no usable answer."""
+    _ddg_blocked.count = ddg_blocked_count() + 1
+
 
 def _extract_ddg_url(ddg_url: str) -> str | None:
     """Extract the actual URL from a DuckDuckGo redirect link."""
@@ -69,6 +86,7 @@ def ddg_search(query: str, max_results: int = 5) -> list[dict]:
             _ddg_consecutive_failures = 0
         else:
             logger.debug("DDG circuit breaker open, skipping: %s", query)
+            note_ddg_blocked()
             return []
 
     with _ddg_lock:
@@ -79,7 +97,7 @@ def ddg_search(query: str, max_results: int = 5) -> list[dict]:
 
         try:
             url = f"https://html.duckduckgo.com/html/?q={requests.utils.quote(query)}"
-            resp = requests.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
+            resp = DDG_SESSION.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
 
             _ddg_last_call = time.time()
 
@@ -89,6 +107,7 @@ def ddg_search(query: str, max_results: int = 5) -> list[dict]:
                     _ddg_disabled = True
                     _ddg_disabled_at = time.time()
                     logger.warning("DDG circuit breaker tripped (403s), cooldown %ds", int(_DDG_COOLDOWN))
+                note_ddg_blocked()
                 return []
 
             resp.raise_for_status()
@@ -132,4 +151,5 @@ def ddg_search(query: str, max_results: int = 5) -> list[dict]:
                 )
             else:
                 logger.debug("DDG search failed for: %s", query, exc_info=True)
+            note_ddg_blocked()
             return []
@@ -9,7 +9,7 @@ import argparse
 import logging
 import sys
 
-from src.db import get_connection, init_db, upsert_job
+from src.db import get_connection, init_db, upsert_job, upsert_pis_bulk
 from src.matching.pi_lookup import lookup_pi_urls
 
 logger = logging.getLogger(__name__)
@@ -59,44 +59,53 @@ def backfill(dry_run: bool = False) -> dict:
     updated = 0
     failed = 0
     skipped = 0
-
-    for job in candidates:
-        pi_name = job["pi_name"]
-        institute = job.get("institute")
-        department = job.get("department")
-        job_id = job["id"]
-
-        try:
-            urls = lookup_pi_urls(pi_name, institute, department)
-
-            update_fields: dict = {}
-            for key in ("scholar_url", "lab_url", "dept_url", "h_index", "citations",
-                        "recent_papers", "top_cited_papers"):
-                if urls.get(key) and not job.get(key):
-                    update_fields[key] = urls[key]
-
-            if update_fields:
-                with get_connection() as conn:
-                    set_clause = ", ".join(f"{k} = ?" for k in update_fields)
-                    values = list(update_fields.values()) + [job_id]
-                    conn.execute(
-                        f"UPDATE jobs SET {set_clause}, updated_at = datetime('now') WHERE id = ?",
-                        values,
+    pending_writes: list[dict] = []
+
+    try:
+        for job in candidates:
+            pi_name = job["pi_name"]
+            institute = job.get("institute")
+            department = job.get("department")
+            job_id = job["id"]
+
+            try:
+                urls = lookup_pi_urls(pi_name, institute, department, pending_writes=pending_writes)
+
+                update_fields: dict = {}
+                for key in ("scholar_url", "lab_url", "dept_url", "h_index", "citations",
+                            "recent_papers", "top_cited_papers"):
+                    if urls.get(key) and not job.get(key):
+                        update_fields[key] = urls[key]
+
+                if update_fields:
+                    with get_connection() as conn:
+                        set_clause = ", ".join(f"{k} = ?" for k in update_fields)
+                        values = list(update_fields.values()) + [job_id]
+                        conn.execute(
+                            f"UPDATE jobs SET {set_clause}, updated_at = datetime('now') WHERE id = ?",
+                            values,
+                        )
+                    updated += 1
+                    logger.info(
+                        "Updated job %d (%s): %s",
+                        job_id,
+                        pi_name,
+                        list(update_fields.keys()),
                     )
-                updated += 1
-                logger.info(
-                    "Updated job %d (%s): %s",
-                    job_id,
-                    pi_name,
-                    list(update_fields.keys()),
-                )
-            else:
-                skipped += 1
-                logger.debug("No new URLs found for job %d (%s)", job_id, pi_name)
-
-        except Exception:
-            failed += 1
-            logger.exception("Failed to backfill job %d (%s)", job_id, pi_name)
+                else:
+                    skipped += 1
+                    logger.debug("No new URLs found for job %d (%s)", job_id, pi_name)
+
+            except Exception:
+                failed += 1
+                logger.exception("Failed to backfill job %d (%s)", job_id, pi_name)
+
+            if len(pending_writes) >= 25:
+                upsert_pis_bulk(pending_writes)
+                pending_writes.clear()
+    finally:
+        # Keep what was looked up even if the run is interrupted
+        upsert_pis_bulk(pending_writes)
 
     summary = {
         "total": len(candidates),
@@ -303,9 +303,18 @@ def _make_dedup_text(job: dict) -> str:
     return f"{title} {inst} {pi}"
 
 
-def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
+def deduplicate_jobs(
+    jobs: list[dict],
+    threshold: float = 0.85,
+    return_losers: bool = False,
+) -> list[dict] | tuple[list[dict], set[str]]:
     """Remove duplicate jobs, keeping the entry with the longest description.
 
+    With *return_losers*, returns ``(unique, loser_urls)`` where
+    ``loser_urls`` are the input URLs that lost a merge and appear in no
+    kept job -- tracked during the merges, so callers need not diff URL
+    sets over all input jobs.
+
     Algorithm
     ---------
     1. Build fast-path indexes (URL set, PI+institute key map) for O(1) exact
@@ -320,9 +329,10 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
     Complexity: O(n) amortised (vs. O(n^2) in the previous implementation).
     """
     if not jobs:
-        return []
+        return ([], set()) if return_losers else []
 
     unique: list[dict] = []
+    losers: set[str] = set()
 
     # Fast-path index: URL -> index in unique[]
     url_index: dict[str, int] = {}
@@ -352,6 +362,16 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
             lsh_tables[band_num][bucket_key].append(idx)
         signatures.append(sig)
 
+    def _merge(idx: int, job: dict) -> None:
+        """Merge *job* into unique[idx], recording the URL that lost."""
+        old = unique[idx]
+        best = _pick_best(old, job)
+        unique[idx] = best
+        best_url = best.get("url")
+        for url in (old.get("url"), job.get("url")):
+            if url and url != best_url:
+                losers.add(url)
+
     for job in jobs:
         # ── Fast path 1: exact URL match ──────────────────────────────
         url = job.get("url")
@@ -362,7 +382,7 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
                 job.get("title", "")[:50],
                 unique[dup_idx].get("title", "")[:50],
             )
-            unique[dup_idx] = _pick_best(unique[dup_idx], job)
+            _merge(dup_idx, job)
             continue
 
         # ── Fast path 2: same PI at same institute ────────────────────
@@ -380,7 +400,7 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
                     job.get("title", "")[:50],
                     unique[dup_idx].get("title", "")[:50],
                 )
-                unique[dup_idx] = _pick_best(unique[dup_idx], job)
+                _merge(dup_idx, job)
                 continue
 
         # ── Fast path 3: same PI name across different institutes ─────
@@ -396,7 +416,7 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
                     job.get("title", "")[:50],
                     unique[matched_idx].get("title", "")[:50],
                 )
-                unique[matched_idx] = _pick_best(unique[matched_idx], job)
+                _merge(matched_idx, job)
                 continue
 
         # ── LSH candidate generation ──────────────────────────────────
@@ -423,7 +443,7 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
                 job.get("title", "")[:50],
                 unique[dup_idx].get("title", "")[:50],
             )
-            unique[dup_idx] = _pick_best(unique[dup_idx], job)
+            _merge(dup_idx, job)
         else:
             new_idx = len(unique)
             unique.append(job)
@@ -432,4 +452,8 @@ def deduplicate_jobs(jobs: list[dict], threshold: float = 0.85) -> list[dict]:
     removed = len(jobs) - len(unique)
     if removed:
         logger.info("Deduplicated: %d → %d jobs (%d removed)", len(jobs), len(unique), removed)
+    if return_losers:
+        # A URL can lose one merge yet still be kept elsewhere
+        losers.difference_update(j.get("url") for j in unique)
+        return unique, losers
     return unique
@@ -4,20 +4,23 @@ Reuses existing infrastructure from seed_profiler and lab_finder,
 adding a caching layer via the pis table and department URL search.
 
 Fallback chain:
-1. Cache check (with negative-cache / 7-day TTL)
+1. Cache check (with negative-cache / 7-day TTL, tracked per source)
 2. Google Scholar direct HTTP scraping -> scholar_url, citations
 3. DDG multi-query -> lab_url  (if Scholar homepage is missing)
 4. Semantic Scholar metadata -> h_index, citations, s2_author_id
+   (batched up front by prefetch_s2_metadata when the author id is cached)
 5. S2 paper fetch -> recent_papers, top_cited_papers
 6. Dept URL search
 7. Cache results
 """
 
+import functools
 import json
 import logging
 import re
 import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Optional
 
 from src import db
@@ -27,45 +30,63 @@ from src.discovery.lab_finder import (
     _search_university_directory,
     find_lab_url_multi_strategy,
 )
-from src.discovery.scholar_scraper import search_scholar_author
+from src.discovery.web_search import ddg_blocked_count
+from src.discovery.scholar_scraper import gs_blocked_count, search_scholar_author
 from src.discovery.seed_profiler import (
     fetch_pi_papers,
     fetch_semantic_scholar_metadata,
+    fetch_semantic_scholar_metadata_batch,
+    s2_blocked_count,
 )
 
 logger = logging.getLogger(__name__)
 
 _RATE_LIMIT = 1.5  # seconds between external requests
 _NEGATIVE_CACHE_DAYS = 7  # skip re-search within this window
+_COMPACT_JSON = (",", ":")  # paper lists are stored on every pis/jobs row
+
+# Per-source attempt timestamps in the pis table; a recent attempt that left
+# the field empty is a negative-cache hit for that source only.
+_LAST_TRY_COLUMNS = {
+    "scholar": "last_try_scholar",
+    "lab": "last_try_lab",
+    "s2": "last_try_s2",
+    "dept": "last_try_dept",
+}
+
+# S2 metadata fetched in bulk by prefetch_s2_metadata(), keyed by authorId
+_S2_PREFETCHED: dict[str, dict] = {}
 
 
 def _get_cached_pi(name: str, institute: Optional[str] = None) -> Optional[dict]:
     """Check the pis table for cached URL data."""
+    columns = (
+        "scholar_url, lab_url, dept_url, h_index, citations,"
+        " s2_author_id, recent_papers, top_cited_papers, last_scraped, "
+        + ", ".join(_LAST_TRY_COLUMNS.values())
+    )
     with db.get_connection() as conn:
         if institute:
             row = conn.execute(
-                "SELECT scholar_url, lab_url, dept_url, h_index, citations,"
-                " s2_author_id, recent_papers, top_cited_papers, last_scraped"
-                " FROM pis WHERE name = ? AND institute = ?",
+                f"SELECT {columns} FROM pis WHERE name = ? AND institute = ?",
                 (name, institute),
             ).fetchone()
         else:
             row = conn.execute(
-                "SELECT scholar_url, lab_url, dept_url, h_index, citations,"
-                " s2_author_id, recent_papers, top_cited_papers, last_scraped"
-                " FROM pis WHERE name = ?",
+                f"SELECT {columns} FROM pis WHERE name = ?",
                 (name,),
             ).fetchone()
         return dict(row) if row else None
 
 
-def _is_negative_cache_valid(cached: dict) -> bool:
-    """Return True if the cached record was scraped recently (within 7 days).
+def _is_negative_cache_valid(cached: dict, column: str = "last_scraped") -> bool:
+    """Return True if the cached timestamp *column* is recent (within 7 days).
 
     A record with no URLs but a recent ``last_scraped`` timestamp means
-    we already tried and found nothing -- skip re-searching.
+    we already tried and found nothing -- skip re-searching.  Pass one of
+    the ``last_try_*`` columns to check a single source instead.
     """
-    last_scraped = cached.get("last_scraped")
+    last_scraped = cached.get(column)
     if not last_scraped:
         return False
     try:
@@ -75,6 +96,33 @@ def _is_negative_cache_valid(cached: dict) -> bool:
         return False
 
 
+def prefetch_s2_metadata(pis: list[tuple[str, Optional[str]]]) -> int:
+    """Batch-fetch S2 metadata for *pis* (name, institute) ahead of a lookup loop.
+
+    Only PIs whose cached row already has an ``s2_author_id`` but lacks
+    h_index or citations can be batched; step 4 of :func:`lookup_pi_urls`
+    reads these instead of running a per-name author search.
+    Returns the number of authors fetched.
+    """
+    wanted = set(pis)
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT name, institute, s2_author_id FROM pis"
+            " WHERE s2_author_id IS NOT NULL AND s2_author_id != ''"
+            " AND (h_index IS NULL OR citations IS NULL)"
+        ).fetchall()
+    author_ids = [
+        r["s2_author_id"] for r in rows
+        if (r["name"], r["institute"]) in wanted and r["s2_author_id"] not in _S2_PREFETCHED
+    ]
+    if not author_ids:
+        return 0
+    fetched = fetch_semantic_scholar_metadata_batch(author_ids)
+    _S2_PREFETCHED.update(fetched)
+    logger.info("Prefetched S2 metadata for %d/%d PIs", len(fetched), len(author_ids))
+    return len(fetched)
+
+
 def _lookup_dept_url(
     department: Optional[str], institute: Optional[str]
 ) -> Optional[str]:
@@ -89,7 +137,7 @@ def _lookup_dept_url(
     return _search_university_directory(department, domain, suffix="department")
 
 
-def _cache_pi_urls(
+def _pi_cache_record(
     name: str,
     institute: Optional[str],
     scholar_url: Optional[str] = None,
@@ -101,9 +149,18 @@ def _cache_pi_urls(
     s2_author_id: Optional[str] = None,
     recent_papers: Optional[str] = None,
     top_cited_papers: Optional[str] = None,
-) -> None:
-    """Upsert PI URL data into the pis cache table."""
-    record: dict = {"name": name, "last_scraped": datetime.now().isoformat()}
+    tried: tuple[str, ...] = (),
+) -> dict:
+    """Build the pis-table row that caches a lookup's results.
+
+    *tried* names the sources (keys of ``_LAST_TRY_COLUMNS``) that were
+    queried in this lookup; their attempt timestamps are refreshed whether
+    or not they found anything.
+    """
+    now = datetime.now().isoformat()
+    record: dict = {"name": name, "last_scraped": now}
+    for source in tried:
+        record[_LAST_TRY_COLUMNS[source]] = now
     if institute:
         record["institute"] = institute
     if scholar_url:
@@ -124,33 +181,15 @@ def _cache_pi_urls(
         record["recent_papers"] = recent_papers
     if top_cited_papers:
         record["top_cited_papers"] = top_cited_papers
-    db.upsert_pi(record)
+    return record
 
 
-def lookup_pi_urls(
+def _lookup_pi_urls_uncached(
     pi_name: str,
-    institute: Optional[str] = None,
-    department: Optional[str] = None,
-) -> dict:
-    """Look up Scholar URL, lab URL, dept URL, and papers for a PI.
-
-    Uses the pis table as a cache.  External requests are rate-limited.
-    Google Scholar uses its own circuit breaker (in scholar_scraper).
-
-    Fallback chain:
-    1. Cache check (with 7-day negative cache TTL)
-    2. Google Scholar direct scraping -> scholar_url, citations
-    3. DDG multi-query -> lab_url (if Scholar homepage absent)
-    4. Semantic Scholar -> h_index, citations, s2_author_id
-    5. S2 paper fetch -> recent_papers, top_cited_papers
-    6. Dept URL search
-    7. Cache results
-
-    Returns
-    -------
-    dict with keys: scholar_url, lab_url, dept_url, h_index, citations,
-                    recent_papers, top_cited_papers
-    """
+    institute: Optional[str],
+    department: Optional[str],
+) -> tuple[dict, Optional[dict]]:
+    """Run the fallback chain; return (result, cache row or None if unchanged)."""
     result: dict = {
         "scholar_url": None,
         "lab_url": None,
@@ -163,8 +202,14 @@ def lookup_pi_urls(
 
     # 1. Cache check
     cached = _get_cached_pi(pi_name, institute)
+    tried: list[str] = []
+    recently_tried: set[str] = set()
     if cached:
-        result.update({k: v for k, v in cached.items() if v and k != "last_scraped"})
+        result.update({k: v for k, v in cached.items() if v and not k.startswith("last_")})
+        recently_tried = {
+            source for source, column in _LAST_TRY_COLUMNS.items()
+            if _is_negative_cache_valid(cached, column)
+        }
         has_scholar = bool(cached.get("scholar_url"))
         has_lab = bool(cached.get("lab_url"))
         has_dept = bool(cached.get("dept_url"))
@@ -173,12 +218,14 @@ def lookup_pi_urls(
         # Full cache hit
         if has_scholar and has_lab and has_dept and has_papers:
             logger.debug("Full cache hit for %s", pi_name)
-            return result
+            return result, None
 
-        # Negative cache: already tried recently and found nothing -- skip
-        if not has_scholar and not has_lab and _is_negative_cache_valid(cached):
+        # Legacy rows without per-source stamps: whole-record negative cache
+        has_source_stamps = any(cached.get(c) for c in _LAST_TRY_COLUMNS.values())
+        if (not has_source_stamps and not has_scholar and not has_lab
+                and _is_negative_cache_valid(cached)):
             logger.debug("Negative cache hit for %s (within %d days)", pi_name, _NEGATIVE_CACHE_DAYS)
-            return result
+            return result, None
 
     # 2. Google Scholar direct scraping (with built-in circuit breaker)
     #    Skip single-name PIs (too ambiguous for Scholar search)
@@ -187,9 +234,13 @@ def lookup_pi_urls(
     is_single_name = " " not in pi_name.strip() and not _is_korean_fullname
     s2_author_id = cached.get("s2_author_id") if cached else None
 
-    if not result.get("scholar_url") and not is_single_name:
+    if not result.get("scholar_url") and not is_single_name and "scholar" not in recently_tried:
         logger.info("Fetching Scholar profile for %s (direct scrape)", pi_name)
+        gs_blocked = gs_blocked_count()
         gs_data = search_scholar_author(pi_name, institute)
+        # Only a completed search is a definitive miss; a blocked one retries.
+        if gs_blocked_count() == gs_blocked:
+            tried.append("scholar")
 
         if gs_data:
             result["scholar_url"] = gs_data.get("scholar_url")
@@ -200,18 +251,28 @@ def lookup_pi_urls(
 
     # 3. DDG multi-query lab URL (if Scholar homepage didn't provide one)
     #    For single-name PIs, combine with institute for better results
-    if not result.get("lab_url"):
+    if not result.get("lab_url") and "lab" not in recently_tried:
         logger.debug("Trying DDG multi-query for %s", pi_name)
+        ddg_blocked = ddg_blocked_count()
         lab_url = find_lab_url_multi_strategy(pi_name, institute)
+        if ddg_blocked_count() == ddg_blocked:
+            tried.append("lab")
         if lab_url:
             result["lab_url"] = lab_url
 
     # 4. Semantic Scholar metadata (h_index, citations, homepage, authorId)
     #    Now supports single-name PIs by cross-referencing with institute
     s2_meta = None
-    if result.get("h_index") is None or result.get("citations") is None or not s2_author_id:
-        logger.debug("Trying Semantic Scholar metadata for %s", pi_name)
-        s2_meta = fetch_semantic_scholar_metadata(pi_name, institute)
+    s2_recent = "s2" in recently_tried
+    s2_queried = False
+    s2_blocked = s2_blocked_count()
+    if (result.get("h_index") is None or result.get("citations") is None or not s2_author_id) \
+            and not s2_recent:
+        s2_queried = True
+        s2_meta = _S2_PREFETCHED.get(s2_author_id) if s2_author_id else None
+        if s2_meta is None:
+            logger.debug("Trying Semantic Scholar metadata for %s", pi_name)
+            s2_meta = fetch_semantic_scholar_metadata(pi_name, institute)
         if s2_meta:
             if result.get("h_index") is None and s2_meta.get("h_index") is not None:
                 result["h_index"] = s2_meta["h_index"]
@@ -229,22 +290,30 @@ def lookup_pi_urls(
                 s2_author_id = s2_meta["authorId"]
 
     # 5. S2 paper fetch (recent + top cited)
-    if not result.get("recent_papers") and s2_author_id:
+    if not result.get("recent_papers") and s2_author_id and not s2_recent:
+        s2_queried = True
         logger.debug("Fetching S2 papers for %s (author_id=%s)", pi_name, s2_author_id)
         paper_data = fetch_pi_papers(pi_name, institute, s2_author_id=s2_author_id)
         if paper_data:
-            result["recent_papers"] = json.dumps(paper_data["recent_papers"])
-            result["top_cited_papers"] = json.dumps(paper_data["top_cited_papers"])
+            result["recent_papers"] = json.dumps(paper_data["recent_papers"], separators=_COMPACT_JSON)
+            result["top_cited_papers"] = json.dumps(paper_data["top_cited_papers"], separators=_COMPACT_JSON)
+
+    # A rate-limited S2 request is retried next time, not negative-cached
+    if s2_queried and s2_blocked_count() == s2_blocked:
+        tried.append("s2")
 
     # 6. Dept URL search (if needed)
-    if not result.get("dept_url") and department:
+    if not result.get("dept_url") and department and "dept" not in recently_tried:
+        ddg_blocked = ddg_blocked_count()
         dept_url = _lookup_dept_url(department, institute)
         time.sleep(_RATE_LIMIT)
+        if ddg_blocked_count() == ddg_blocked:
+            tried.append("dept")
         if dept_url:
             result["dept_url"] = dept_url
 
     # 7. Cache the results
-    _cache_pi_urls(
+    record = _pi_cache_record(
         name=pi_name,
         institute=institute,
         scholar_url=result.get("scholar_url"),
@@ -255,6 +324,68 @@ def lookup_pi_urls(
         s2_author_id=s2_author_id,
         recent_papers=result.get("recent_papers"),
         top_cited_papers=result.get("top_cited_papers"),
+        tried=tuple(tried),
     )
+    return result, record
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_pi_urls_memo(
+    pi_name: str,
+    institute: Optional[str],
+    department: Optional[str],
+) -> tuple[MappingProxyType, list[dict]]:
+    """Per-process memo over the fallback chain.
+
+    The cache row rides along in a one-element list that the first caller
+    pops and writes, so repeated lookups never rewrite the same row.
+    """
+    result, record = _lookup_pi_urls_uncached(pi_name, institute, department)
+    return MappingProxyType(result), [record] if record else []
+
+
+def lookup_pi_urls(
+    pi_name: str,
+    institute: Optional[str] = None,
+    department: Optional[str] = None,
+    pending_writes: Optional[list[dict]] = None,
+) -> dict:
+    """Look up Scholar URL, lab URL, dept URL, and papers for a PI.
+
+    Uses the pis table as a cache.  External requests are rate-limited.
+    Google Scholar uses its own circuit breaker (in scholar_scraper).
+    Repeated calls with the same (name, institute, department) within a
+    process are answered from an in-memory memo; ``clear_pi_lookup_cache()``
+    resets it.  Batch callers may pass *pending_writes*: the cache row is
+    appended to it instead of written, for the caller to ``db.upsert_pis_bulk``.
+
+    Fallback chain:
+    1. Cache check (with 7-day negative cache TTL, per source)
+    2. Google Scholar direct scraping -> scholar_url, citations
+    3. DDG multi-query -> lab_url (if Scholar homepage absent)
+    4. Semantic Scholar -> h_index, citations, s2_author_id
+    5. S2 paper fetch -> recent_papers, top_cited_papers
+    6. Dept URL search
+    7. Cache results
+
+    Returns
+    -------
+    dict with keys: scholar_url, lab_url, dept_url, h_index, citations,
+                    recent_papers, top_cited_papers
+    """
+    result, unwritten = _lookup_pi_urls_memo(pi_name, institute, department)
+    try:
+        record = unwritten.pop()
+    except IndexError:
+        record = None
+    if record is not None:
+        if pending_writes is None:
+            db.upsert_pi(record)
+        else:
+            pending_writes.append(record)
+    return dict(result)
+
 
-    return result
+def clear_pi_lookup_cache() -> None:
+    """Forget the per-process ``lookup_pi_urls`` memo."""
+    _lookup_pi_urls_memo.cache_clear()
@@ -1,8 +1,10 @@
 """Score job postings against CV keywords and preferences."""
 
+import functools
 import logging
 import re
 import unicodedata
+from operator import itemgetter
 
 from src.config import (
     COUNTRY_TO_REGION,
@@ -16,7 +18,8 @@ logger = logging.getLogger(__name__)
 
 
 def _normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text.lower().strip())
+    # Same result as re.sub(r"\s+", " ", ...) + strip(), without the regex
+    return " ".join(text.lower().split())
 
 
 def _strip_accents(text: str) -> str:
@@ -76,6 +79,25 @@ _CV_KEYWORD_KR: dict[str, list[str]] = {
 }
 
 
+@functools.lru_cache(maxsize=4)
+def _keyword_terms(keywords: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]:
+    """Lower-case *keywords* once, split by whether they have Korean synonyms.
+
+    Returns ``(plain, with_synonyms)``: keywords matched by a single
+    substring test, and ``(keyword, *synonyms)`` groups where any term counts.
+    """
+    plain: list[str] = []
+    with_synonyms: list[tuple[str, ...]] = []
+    for kw in keywords:
+        kw_lower = kw.lower()
+        synonyms = _CV_KEYWORD_KR.get(kw_lower)
+        if synonyms:
+            with_synonyms.append((kw_lower, *synonyms))
+        else:
+            plain.append(kw_lower)
+    return tuple(plain), tuple(with_synonyms)
+
+
 def keyword_match_score(job_text: str, keywords: list[str] = None) -> float:
     """Calculate keyword overlap score (0.0 - 1.0).
 
@@ -88,19 +110,82 @@ def keyword_match_score(job_text: str, keywords: list[str] = None) -> float:
         return 0.0
 
     text = _normalize(job_text)
-    matches = 0
-    for kw in keywords:
-        kw_lower = kw.lower()
-        if kw_lower in text:
+    plain, with_synonyms = _keyword_terms(tuple(keywords))
+    matches = sum(1 for kw in plain if kw in text)
+    for terms in with_synonyms:
+        if any(term in text for term in terms):
             matches += 1
-        else:
-            # Try Korean synonyms
-            kr_syns = _CV_KEYWORD_KR.get(kw_lower, [])
-            if any(syn in text for syn in kr_syns):
-                matches += 1
     return matches / len(keywords)
 
 
+_RankingsIndex = dict[str, list[tuple] | dict[str, int]]
+
+# (rankings dict, index) -- rebuilt only when load_rankings returns a new object
+_RANKINGS_INDEX: tuple[dict, _RankingsIndex] | None = None
+
+
+def _rankings_index() -> _RankingsIndex:
+    """Return the rankings with every name pre-passed through ``_norm_inst``.
+
+    Keys: ``aliases`` -> [(alias, canonical)], ``tiers`` / ``top_companies``
+    / ``companies`` -> [(tier, name)], all in JSON order, plus ``exact``:
+    {name: tier} giving the scan result for every ranked name up front.
+    """
+    global _RANKINGS_INDEX
+    rankings = load_rankings()
+    if _RANKINGS_INDEX is not None and _RANKINGS_INDEX[0] is rankings:
+        return _RANKINGS_INDEX[1]
+
+    index: _RankingsIndex = {
+        "aliases": [
+            (_norm_inst(alias), _norm_inst(canonical))
+            for alias, canonical in rankings.get("tier_lookup_aliases", {}).items()
+        ],
+        "tiers": [],
+    }
+    for tier_num, tier_data in rankings.get("tiers", {}).items():
+        try:
+            tier_int = int(tier_num)
+        except (ValueError, TypeError):
+            continue
+        index["tiers"].extend(
+            (tier_int, _norm_inst(inst)) for inst in tier_data.get("institutions", [])
+        )
+
+    companies = rankings.get("companies", {})
+    for section, default_tier in (("top_companies", 2), ("companies", 3)):
+        group = companies.get(section, {})
+        if isinstance(group, dict):
+            tier_int = group.get("tier_equivalent", default_tier)
+            names = group.get("institutions", [])
+        else:
+            tier_int, names = default_tier, group
+        index[section] = [(tier_int, _norm_inst(inst)) for inst in names]
+
+    # Exact hits skip the scan; values come from the scan itself so an
+    # earlier substring match still wins exactly as it would at lookup time.
+    index["exact"] = {}
+    for section in _TIER_SECTIONS:
+        for _, ref in index[section]:
+            if ref not in index["exact"]:
+                index["exact"][ref] = _scan_tiers(index, ref)
+
+    _RANKINGS_INDEX = (rankings, index)
+    return index
+
+
+_TIER_SECTIONS = ("tiers", "top_companies", "companies")
+
+
+def _scan_tiers(index: _RankingsIndex, inst_norm: str) -> int:
+    """Return the first tier whose name contains or is contained in *inst_norm*."""
+    for section in _TIER_SECTIONS:
+        for tier_int, ref in index[section]:
+            if ref in inst_norm or inst_norm in ref:
+                return tier_int
+    return 5
+
+
 def get_institution_tier(institute: str) -> int:
     """Look up institution tier from rankings. Returns 1-5 (5 = unranked).
 
@@ -111,50 +196,21 @@ def get_institution_tier(institute: str) -> int:
     if not institute:
         return 5
 
-    rankings = load_rankings()
-    tiers = rankings.get("tiers", {})
-    aliases = rankings.get("tier_lookup_aliases", {})
+    index = _rankings_index()
     inst_norm = _norm_inst(institute)
 
     # Check aliases first (normalized, short aliases require exact match)
-    for alias, canonical in aliases.items():
-        alias_n = _norm_inst(alias)
-        if alias_n == inst_norm:
-            inst_norm = _norm_inst(canonical)
-            break
+    for alias_n, canonical_n in index["aliases"]:
         # Only do substring match for aliases >= 5 chars to avoid false positives
-        if len(alias_n) >= 5 and alias_n in inst_norm:
-            inst_norm = _norm_inst(canonical)
+        if alias_n == inst_norm or (len(alias_n) >= 5 and alias_n in inst_norm):
+            inst_norm = canonical_n
             break
 
-    # Check tiers 1-4
-    for tier_num, tier_data in tiers.items():
-        try:
-            tier_int = int(tier_num)
-        except (ValueError, TypeError):
-            continue
-        for inst in tier_data.get("institutions", []):
-            ref = _norm_inst(inst)
-            if ref in inst_norm or inst_norm in ref:
-                return tier_int
-
-    # Check companies section
-    companies = rankings.get("companies", {})
-    top_co = companies.get("top_companies", {})
-    top_list = top_co.get("institutions", []) if isinstance(top_co, dict) else top_co
-    for inst in top_list:
-        ref = _norm_inst(inst)
-        if ref in inst_norm or inst_norm in ref:
-            return top_co.get("tier_equivalent", 2) if isinstance(top_co, dict) else 2
-
-    std_co = companies.get("companies", {})
-    std_list = std_co.get("institutions", []) if isinstance(std_co, dict) else std_co
-    for inst in std_list:
-        ref = _norm_inst(inst)
-        if ref in inst_norm or inst_norm in ref:
-            return std_co.get("tier_equivalent", 3) if isinstance(std_co, dict) else 3
-
-    return 5
+    # Exact name hit, else check tiers 1-4, then companies
+    tier = index["exact"].get(inst_norm)
+    if tier is not None:
+        return tier
+    return _scan_tiers(index, inst_norm)
 
 
 def is_company(institute: str) -> bool:
@@ -165,14 +221,11 @@ def is_company(institute: str) -> bool:
     """
     if not institute:
         return False
-    rankings = load_rankings()
-    companies = rankings.get("companies", {})
+    index = _rankings_index()
     inst_n = _norm_inst(institute)
 
-    for group in companies.values():
-        comp_list = group.get("institutions", []) if isinstance(group, dict) else group
-        for comp in comp_list:
-            comp_n = _norm_inst(comp)
+    for section in ("top_companies", "companies"):
+        for _, comp_n in index[section]:
             shorter = min(len(inst_n), len(comp_n))
             if shorter < 5:
                 if inst_n == comp_n:
@@ -212,14 +265,10 @@ def get_region(country: str) -> str:
     return "Other"
 
 
-def score_job(job: dict, keywords: list[str] = None) -> dict:
-    """Score a job and enrich with region/tier info.
+def _score_fields(job: dict, keywords: list[str] = None) -> tuple:
+    """Write match_score/region/tier into *job* and return its sort key.
 
-    Returns the job dict with added fields:
-      - match_score: float (0.0 - 1.0)
-      - region: str
-      - tier: int (1-5, where 5 = unranked)
-      - sort_key: tuple for sorting
+    Sort key: region priority ASC, tier ASC, h_index DESC, match_score DESC.
     """
     text = " ".join(
         str(job.get(f, ""))
@@ -238,19 +287,33 @@ def score_job(job: dict, keywords: list[str] = None) -> dict:
     job["region"] = region
     job["tier"] = tier
 
-    # Sort key: region priority ASC, tier ASC, h_index DESC, match_score DESC
-    job["sort_key"] = (
+    return (
         REGION_PRIORITY.get(region, 99),
         tier,
         -h_index,
         -match_score,
     )
 
+
+def score_job(job: dict, keywords: list[str] = None) -> dict:
+    """Score a job and enrich with region/tier info.
+
+    Returns the job dict with added fields:
+      - match_score: float (0.0 - 1.0)
+      - region: str
+      - tier: int (1-5, where 5 = unranked)
+      - sort_key: tuple for sorting
+    """
+    job["sort_key"] = _score_fields(job, keywords)
     return job
 
 
 def score_and_sort_jobs(jobs: list[dict], keywords: list[str] = None) -> list[dict]:
-    """Score and sort a list of jobs by priority."""
-    scored = [score_job(j, keywords) for j in jobs]
-    scored.sort(key=lambda j: j["sort_key"])
-    return scored
+    """Score and sort a list of jobs by priority.
+
+    Sorts (sort_key, job) pairs instead of storing ``sort_key`` on every
+    job dict; callers only need the order.
+    """
+    decorated = [(_score_fields(j, keywords), j) for j in jobs]
+    decorated.sort(key=itemgetter(0))
+    return [j for _, j in decorated]
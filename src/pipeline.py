@@ -8,70 +8,157 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
+import functools
+import gc
+import importlib
+import itertools
 import logging
+import logging.handlers
+import queue
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from src.config import LOG_DIR
-from src.db import init_db, log_scrape
+from src.db import (
+    get_connection,
+    get_jobs,
+    get_new_jobs_since,
+    init_db,
+    log_scrape,
+    update_jobs_by_url,
+    upsert_pis_bulk,
+)
+
+try:
+    import uvloop
+except ImportError:  # optional; unavailable on Windows
+    uvloop = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional; fall back to _DDG_RESULT_RE
+    HTMLParser = None
 
 logger = logging.getLogger(__name__)
 
 
+def _run_async(coro):
+    """``asyncio.run(coro)``, on a libuv event loop when uvloop is installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+def _enable_eager_tasks() -> None:
+    """Run new tasks up to their first ``await`` inline (Python 3.12+ only).
+
+    Saves one event-loop hop per task created by ``asyncio.gather``.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
+
+
+# Background thread writing queued log records; see setup_logging()
+_LOG_LISTENER: logging.handlers.QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the listener thread."""
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_logging(verbose: bool = False) -> None:
-    """Configure logging to file and console."""
+    """Configure logging to file and console.
+
+    Records are handed to a ``QueueListener`` thread that owns the file
+    and console handlers, so scraper threads and the event loop never
+    block on log I/O.  Safe to call again: the previous listener is
+    stopped and ``force=True`` replaces the root handler instead of
+    stacking duplicates.  The log file is opened on the first record.
+    """
+    global _LOG_LISTENER
     level = logging.DEBUG if verbose else logging.INFO
     log_file = LOG_DIR / f"pipeline_{datetime.now().strftime('%Y-%m-%d')}.log"
 
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    handlers = [logging.FileHandler(str(log_file), delay=True), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _LOG_LISTENER = logging.handlers.QueueListener(log_queue, *handlers)
+    _LOG_LISTENER.start()
+
     logging.basicConfig(
         level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.FileHandler(str(log_file)),
-            logging.StreamHandler(),
-        ],
+        format="%(message)s",  # formatting happens on the listener side
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True,
     )
 
 
-def _build_scrapers() -> list:
-    """Instantiate all available scrapers."""
-    from src.scrapers.nature_careers import NatureCareersScraper
-    from src.scrapers.jobspy_scraper import JobSpyScraper
-    from src.scrapers.euraxess import EuraxessScraper
-    from src.scrapers.academicpositions import AcademicPositionsScraper
-    from src.scrapers.scholarshipdb import ScholarshipDBScraper
-    from src.scrapers.researchgate import ResearchGateScraper
-    from src.scrapers.lab_websites import LabWebsiteScraper
-    from src.scrapers.institutional import InstitutionalPortalScraper
-
-    scrapers = [
-        NatureCareersScraper(),
-        JobSpyScraper(),
-        EuraxessScraper(),
-        InstitutionalPortalScraper(),
-        AcademicPositionsScraper(),
-        ScholarshipDBScraper(),
-        ResearchGateScraper(),
-        LabWebsiteScraper(),
-    ]
+# Scrapers to run, as (module path, class name), in run order.
+_SCRAPERS = (
+    ("src.scrapers.nature_careers", "NatureCareersScraper"),
+    ("src.scrapers.jobspy_scraper", "JobSpyScraper"),
+    ("src.scrapers.euraxess", "EuraxessScraper"),
+    ("src.scrapers.institutional", "InstitutionalPortalScraper"),
+    ("src.scrapers.academicpositions", "AcademicPositionsScraper"),
+    ("src.scrapers.scholarshipdb", "ScholarshipDBScraper"),
+    ("src.scrapers.researchgate", "ResearchGateScraper"),
+    ("src.scrapers.lab_websites", "LabWebsiteScraper"),
+)
 
-    # Conditionally add scrapers that may have import issues
-    # Glassdoor disabled: consistently returns 0 results, blocks Playwright for ~3min
-    for cls_path, label in [
-        ("src.scrapers.jobs_ac_uk", "JobsAcUkScraper"),
-        ("src.scrapers.jobs_ac_kr", "JobsAcKrScraper"),
-        ("src.scrapers.wanted", "WantedScraper"),
-        ("src.scrapers.korean_jobs", "KoreanJobsScraper"),
-    ]:
+# Scrapers that may have import issues; skipped with a warning if so.
+# Glassdoor disabled: consistently returns 0 results, blocks Playwright for ~3min
+_OPTIONAL_SCRAPERS = (
+    ("src.scrapers.jobs_ac_uk", "JobsAcUkScraper"),
+    ("src.scrapers.jobs_ac_kr", "JobsAcKrScraper"),
+    ("src.scrapers.wanted", "WantedScraper"),
+    ("src.scrapers.korean_jobs", "KoreanJobsScraper"),
+)
+
+
+@functools.cache
+def _scraper_classes() -> tuple[type, ...]:
+    """Import the scraper modules once and return the available classes.
+
+    Optional scrapers that fail to import are left out (and warned about)
+    only once per process; a core scraper that fails to import raises.
+    """
+    entries = [(path, label, False) for path, label in _SCRAPERS]
+    entries += [(path, label, True) for path, label in _OPTIONAL_SCRAPERS]
+
+    classes = []
+    for cls_path, label, optional in entries:
         try:
-            import importlib
-            mod = importlib.import_module(cls_path)
-            cls = getattr(mod, label)
-            scrapers.append(cls())
+            classes.append(getattr(importlib.import_module(cls_path), label))
         except (ImportError, AttributeError):
+            if not optional:
+                raise
             logger.warning("%s scraper unavailable", label)
 
-    return scrapers
+    return tuple(classes)
+
+
+def _build_scrapers() -> list:
+    """Instantiate all available scrapers, in table order."""
+    return [cls() for cls in _scraper_classes()]
 
 
 def _run_single_scraper(scraper) -> list[dict]:
@@ -113,40 +200,60 @@ async def _async_run_single_scraper(scraper) -> list[dict]:
         return []
 
 
-async def _async_run_all_scrapers(scrapers: list) -> list[dict]:
-    """Run all scrapers concurrently using asyncio.gather."""
-    tasks = [_async_run_single_scraper(s) for s in scrapers]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    all_jobs: list[dict] = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.error(
-                "%s raised exception: %s",
-                scrapers[i].name, result, exc_info=result,
-            )
-        elif isinstance(result, list):
-            all_jobs.extend(result)
+async def _close_scraper_resources() -> None:
+    """Close the shared async browser, aiohttp session and sync browser.
 
-    # Close shared async browser + aiohttp session
+    Best-effort: a failing import or close is logged at debug level and
+    never prevents the remaining resources from being released.  The
+    imports stay local so importing the pipeline doesn't load every scraper.
+    """
     try:
         from src.scrapers.browser import async_close_browser
         await async_close_browser()
     except Exception:
-        pass
+        logger.debug("Closing async browser failed", exc_info=True)
 
     try:
         from src.scrapers.base import _AsyncSessionManager
         await _AsyncSessionManager.close()
     except Exception:
-        pass
+        logger.debug("Closing aiohttp session failed", exc_info=True)
 
     # Also close sync browser if any scraper used it as fallback
+    _close_sync_browser()
+
+
+def _close_sync_browser() -> None:
+    """Close the shared sync Playwright browser if it was started."""
     try:
         from src.scrapers.browser import close_browser
         close_browser()
     except Exception:
-        pass
+        logger.debug("Closing sync browser failed", exc_info=True)
+
+
+async def _async_run_all_scrapers(scrapers: list) -> list[dict]:
+    """Run all scrapers concurrently using asyncio.gather.
+
+    Shared browser/session resources are closed even if the run is
+    cancelled (e.g. Ctrl-C) part-way through.
+    """
+    _enable_eager_tasks()
+    tasks = [_async_run_single_scraper(s) for s in scrapers]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await _close_scraper_resources()
+
+    all_jobs: list[dict] = []
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error(
+                "%s raised exception: %s",
+                scrapers[i].name, result, exc_info=result,
+            )
+        elif isinstance(result, list):
+            all_jobs.extend(result)
 
     return all_jobs
 
@@ -167,20 +274,20 @@ def run_scrapers(sequential: bool = False) -> list[dict]:
         for scraper in scrapers:
             all_jobs.extend(_run_single_scraper(scraper))
     else:
-        all_jobs = asyncio.run(_async_run_all_scrapers(scrapers))
+        all_jobs = _run_async(_async_run_all_scrapers(scrapers))
 
     # Close shared Playwright browser if it was used (sync fallback)
-    try:
-        from src.scrapers.browser import close_browser
-        close_browser()
-    except Exception:
-        pass
+    _close_sync_browser()
 
     return all_jobs
 
 
 def run_scoring(jobs: list[dict]) -> list[dict]:
     """Score and sort collected jobs."""
+    if not jobs:
+        # Nothing new to score; skip the DB-wide dedup pass in _persist_alt_urls
+        return jobs
+
     from src.matching.cv_parser import load_cached_keywords
     from src.matching.scorer import score_and_sort_jobs
     from src.matching.dedup import deduplicate_jobs
@@ -205,8 +312,6 @@ def _persist_match_scores(jobs: list[dict]) -> None:
     Persists ALL scores (including 0) so that every job is evaluated
     and stale scores from previous runs are updated.
     """
-    from src.db import get_connection
-
     updates = [
         (j["match_score"], j.get("region"), j.get("tier"), j["url"])
         for j in jobs
@@ -215,9 +320,14 @@ def _persist_match_scores(jobs: list[dict]) -> None:
     if not updates:
         return
     with get_connection() as conn:
-        conn.executemany(
-            "UPDATE jobs SET match_score = ?, region = COALESCE(?, region),"
-            " tier = COALESCE(?, tier) WHERE url = ?",
+        update_jobs_by_url(
+            conn,
+            {
+                "match_score": "v.score",
+                "region": "COALESCE(v.region, jobs.region)",
+                "tier": "COALESCE(v.tier, jobs.tier)",
+            },
+            ("score", "region", "tier"),
             updates,
         )
     scored = sum(1 for u in updates if u[0] > 0)
@@ -233,17 +343,12 @@ def _persist_alt_urls(jobs: list[dict]) -> None:
     The "loser" (duplicate) rows are marked status='merged' so they
     don't appear in Excel export.
     """
-    from src.db import get_connection, get_jobs
     from src.matching.dedup import deduplicate_jobs
 
     all_jobs = get_jobs(limit=10000)
-    all_urls = {j.get("url") for j in all_jobs if j.get("url")}
-
-    deduped = deduplicate_jobs(all_jobs)
-    kept_urls = {j.get("url") for j in deduped if j.get("url")}
 
-    # URLs that were in the original but not in the deduped list = losers
-    loser_urls = all_urls - kept_urls
+    # Losers = URLs merged away during dedup and not kept by any winner
+    deduped, loser_urls = deduplicate_jobs(all_jobs, return_losers=True)
 
     # Collect alt_url updates from cross-source merges
     updates = []
@@ -256,73 +361,144 @@ def _persist_alt_urls(jobs: list[dict]) -> None:
         return
     with get_connection() as conn:
         if updates:
-            conn.executemany(
-                "UPDATE jobs SET alt_url = ? WHERE url = ? AND (alt_url IS NULL OR alt_url = '')",
+            update_jobs_by_url(
+                conn,
+                {"alt_url": "v.alt_url"},
+                ("alt_url",),
                 [(u[0], u[2]) for u in updates],
+                where="(jobs.alt_url IS NULL OR jobs.alt_url = '')",
             )
             # Backfill pi_name from merged data
-            conn.executemany(
-                "UPDATE jobs SET pi_name = ? WHERE url = ? AND (pi_name IS NULL OR pi_name = '') AND ? != ''",
-                [(u[1], u[2], u[1]) for u in updates],
+            update_jobs_by_url(
+                conn,
+                {"pi_name": "v.pi_name"},
+                ("pi_name",),
+                [(u[1], u[2]) for u in updates],
+                where="(jobs.pi_name IS NULL OR jobs.pi_name = '') AND v.pi_name != ''",
             )
         # Dismiss all loser rows so they don't appear in exports
         # Never change dismissed status — user explicitly removed those
         if loser_urls:
-            conn.executemany(
-                "UPDATE jobs SET status = 'merged' WHERE url = ? AND status = 'new'",
+            update_jobs_by_url(
+                conn,
+                {"status": "'merged'"},
+                (),
                 [(url,) for url in loser_urls],
+                where="jobs.status = 'new'",
             )
             logger.info("Dismissed %d duplicate rows (status='merged')", len(loser_urls))
     logger.info("Persisted alt_url for %d cross-source duplicates", len(updates))
 
 
+# Soft wall-clock budget (seconds) for each network enrichment stage.  When
+# Scholar or DDG is slow the report goes out partially enriched instead of
+# late; both stages work through their candidates best match_score first, so
+# what the budget cuts off are the weakest matches.
+ENRICHMENT_BUDGET_S = 600
+
+
+# PI cache rows are written in batches of this many, so an interrupted
+# run keeps what it already looked up
+_PI_WRITE_BATCH = 25
+
+
+def _flush_pi_writes(pending_writes: list[dict]) -> int:
+    """Write and remove the queued PI cache rows; returns how many.
+
+    Lookup threads only ever append, so the rows snapshotted here are
+    still the list's head when they are removed after the write.
+    """
+    batch = pending_writes[:]
+    if batch:
+        upsert_pis_bulk(batch)
+        del pending_writes[:len(batch)]
+    return len(batch)
+
+
 def run_pi_enrichment(jobs: list[dict], max_workers: int = 2) -> list[dict]:
     """Batch PI URL lookup for jobs that have a pi_name but missing URLs.
 
     Runs after scraping/scoring so it doesn't block scrapers.
-    Uses asyncio with a semaphore for controlled concurrency
-    (Scholar rate-limits aggressively).
+    ``max_workers`` worker coroutines pull jobs from a queue, so
+    concurrency stays bounded (Scholar rate-limits aggressively) without
+    a task per candidate.  Lookups run on a dedicated
+    ``max_workers``-thread executor.  Candidates are queued by descending
+    ``match_score``; those still queued after ``ENRICHMENT_BUDGET_S`` are
+    skipped.  PI cache rows are written every
+    ``_PI_WRITE_BATCH`` lookups and again on the way out, even on error.
     """
-    candidates = [
-        j for j in jobs
-        if j.get("pi_name") and not (j.get("scholar_url") and j.get("lab_url"))
-    ]
+    candidates = sorted(
+        (j for j in jobs
+         if j.get("pi_name") and not (j.get("scholar_url") and j.get("lab_url"))),
+        key=lambda j: -(j.get("match_score") or 0),
+    )
     if not candidates:
         return jobs
 
     logger.info("PI enrichment: %d jobs need URL lookup", len(candidates))
+    pending_writes: list[dict] = []
+    written = 0
 
-    async def _async_pi_enrichment() -> None:
-        sem = asyncio.Semaphore(max_workers)
-        done_count = 0
+    from src.matching.pi_lookup import lookup_pi_urls, prefetch_s2_metadata
+    prefetch_s2_metadata([(j["pi_name"], j.get("institute")) for j in candidates])
+
+    async def _async_pi_enrichment(executor: ThreadPoolExecutor) -> None:
+        _enable_eager_tasks()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict] = asyncio.Queue()
+        for job in candidates:
+            queue.put_nowait(job)
+        done = 0
+        log_every = 4 * max_workers
 
         async def _lookup_one(job: dict) -> None:
-            nonlocal done_count
-            async with sem:
-                loop = asyncio.get_running_loop()
+            try:
+                def _do_lookup() -> dict:
+                    return lookup_pi_urls(
+                        job["pi_name"], job.get("institute"), job.get("department"),
+                        pending_writes=pending_writes,
+                    )
+
+                urls = await loop.run_in_executor(executor, _do_lookup)
+                for key in ("scholar_url", "lab_url", "dept_url", "h_index",
+                            "citations", "recent_papers", "top_cited_papers"):
+                    if urls.get(key) and not job.get(key):
+                        job[key] = urls[key]
+            except Exception:
+                logger.debug("PI lookup failed for %s", job.get("pi_name"))
+
+        async def _worker() -> None:
+            nonlocal done, written
+            while True:
+                job = await queue.get()
                 try:
-                    def _do_lookup() -> dict:
-                        from src.matching.pi_lookup import lookup_pi_urls
-                        return lookup_pi_urls(
-                            job["pi_name"], job.get("institute"), job.get("department")
-                        )
-
-                    urls = await loop.run_in_executor(None, _do_lookup)
-                    for key in ("scholar_url", "lab_url", "dept_url", "h_index",
-                                "citations", "recent_papers", "top_cited_papers"):
-                        if urls.get(key) and not job.get(key):
-                            job[key] = urls[key]
-                except Exception:
-                    logger.debug("PI lookup failed for %s", job.get("pi_name"))
-
-                done_count += 1
-                if done_count % 10 == 0:
-                    logger.info("PI enrichment progress: %d/%d", done_count, len(candidates))
-
-        await asyncio.gather(*[_lookup_one(j) for j in candidates])
-
-    asyncio.run(_async_pi_enrichment())
-    logger.info("PI enrichment complete")
+                    await _lookup_one(job)
+                finally:
+                    queue.task_done()
+                done += 1
+                if len(pending_writes) >= _PI_WRITE_BATCH:
+                    written += _flush_pi_writes(pending_writes)
+                if done % log_every == 0 or done == len(candidates):
+                    logger.info("PI enrichment progress: %d/%d", done, len(candidates))
+
+        workers = [asyncio.create_task(_worker()) for _ in range(max_workers)]
+        try:
+            await asyncio.wait_for(queue.join(), timeout=ENRICHMENT_BUDGET_S)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "PI enrichment budget expired: %d/%d enriched", done, len(candidates),
+            )
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pi-lookup") as executor:
+            _run_async(_async_pi_enrichment(executor))
+    finally:
+        written += _flush_pi_writes(pending_writes)
+    logger.info("PI enrichment complete (%d PI cache rows written)", written)
     return jobs
 
 
@@ -338,33 +514,141 @@ CREATE TABLE IF NOT EXISTS dept_url_cache (
 
 MAX_DEPT_LOOKUPS_PER_RUN = 200  # effectively unlimited; circuit breaker handles abuse
 
+# Result links in DuckDuckGo HTML: <a class="result__a" href="...">
+_DDG_RESULT_RE = re.compile(r'class="result__a"[^>]*href="([^"]+)"')
+_DEPT_LOOKUP_CONCURRENCY = 3  # overlapping DDG searches in run_dept_enrichment
+
+
+def _ddg_result_links(html: str) -> list[str]:
+    """Return result hrefs from a DDG HTML page, in page order.
+
+    Uses selectolax's C parser when installed, else the regex.
+    """
+    if HTMLParser is None:
+        return _DDG_RESULT_RE.findall(html)
+    links = (node.attributes.get("href") for node in HTMLParser(html).css("a.result__a"))
+    return [href for href in links if href]
+
 
 def _init_dept_cache() -> None:
-    from src.db import get_connection
     with get_connection() as conn:
         conn.executescript(_DEPT_CACHE_TABLE)
 
 
-def _get_cached_dept(institute: str, dept_hint: str) -> tuple[bool, str | None]:
-    """Check cache. Returns (found_in_cache, url_or_none)."""
-    from src.db import get_connection
+def _load_dept_cache() -> dict[tuple[str, str], str | None]:
+    """Read the whole dept cache as {(institute, dept_hint): url_or_none}."""
     with get_connection() as conn:
-        row = conn.execute(
-            "SELECT dept_url FROM dept_url_cache WHERE institute = ? AND dept_hint = ?",
-            (institute.strip().lower(), dept_hint.strip().lower()),
-        ).fetchone()
-        if row:
-            return True, row["dept_url"]
-        return False, None
+        rows = conn.execute(
+            "SELECT institute, dept_hint, dept_url FROM dept_url_cache"
+        ).fetchall()
+    return {(r["institute"], r["dept_hint"]): r["dept_url"] for r in rows}
 
 
-def _save_dept_cache(institute: str, dept_hint: str, url: str | None) -> None:
-    from src.db import get_connection
+def _save_dept_cache(rows: list[tuple[str, str, str | None]]) -> None:
+    """Upsert (institute, dept_hint, url) rows into the dept cache."""
+    if not rows:
+        return
     with get_connection() as conn:
-        conn.execute(
+        conn.executemany(
             "INSERT OR REPLACE INTO dept_url_cache (institute, dept_hint, dept_url) "
             "VALUES (?, ?, ?)",
-            (institute.strip().lower(), dept_hint.strip().lower(), url),
+            [(inst.strip().lower(), hint.strip().lower(), url) for inst, hint, url in rows],
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_key_part(text: str) -> str:
+    """strip().lower(), shared across the many jobs from one institute."""
+    return text.strip().lower()
+
+
+def _search_dept_urls(
+    keys: list[tuple[str, str]], new_rows: list[tuple[str, str, str | None]],
+) -> None:
+    """DDG-search department URLs for uncached (institute, dept_hint) keys.
+
+    Appends ``(institute, dept_hint, url_or_none)`` to *new_rows* as each
+    search finishes, so the caller can persist partial progress.  DDG
+    rate-limits parallel requests aggressively, so at most
+    ``_DEPT_LOOKUP_CONCURRENCY`` searches overlap, each followed by a
+    pause; 5 misses in a row open a circuit breaker for the rest.  Keys
+    are searched in the order given.  Searches still pending after ``ENRICHMENT_BUDGET_S`` are cancelled
+    and left uncached for the next run.
+    """
+    import aiohttp
+
+    from src.discovery.lab_finder import _extract_ddg_url, _institute_to_domain, _is_valid_lab_url
+
+    def _pick_dept_url(html: str, domain: str | None) -> str | None:
+        """Pick the best department link from a DDG results page."""
+        urls = _ddg_result_links(html)
+        for candidate in urls[:5]:
+            real = _extract_ddg_url(candidate)
+            if not real or not _is_valid_lab_url(real):
+                continue
+            # Prefer results on the institute's own domain
+            if domain and domain in real:
+                return real
+        # Fallback: return first valid result
+        for candidate in urls[:3]:
+            real = _extract_ddg_url(candidate)
+            if real and _is_valid_lab_url(real):
+                return real
+        return None
+
+    async def _lookup_dept(
+        session: aiohttp.ClientSession, institute: str, dept_hint: str,
+    ) -> str | None:
+        """Search DDG directly for '{institute} {dept_hint} department' (no site: operator)."""
+        # May itself hit DDG for unknown institutes -- keep it off the loop
+        domain = await asyncio.to_thread(_institute_to_domain, institute)
+        query = f"{institute} {dept_hint} department".strip() if dept_hint else f"{institute} research department"
+        try:
+            async with session.get("https://html.duckduckgo.com/html/", params={"q": query}) as resp:
+                if resp.status == 403:
+                    logger.debug("DDG 403 for dept lookup: %s", institute)
+                    return None
+                resp.raise_for_status()
+                html = await resp.text()
+            await asyncio.sleep(2.5)
+            return _pick_dept_url(html, domain)
+        except Exception:
+            logger.debug("Dept DDG search failed for %s", institute)
+        return None
+
+    consecutive_failures = 0
+
+    async def _search_all() -> None:
+        sem = asyncio.Semaphore(_DEPT_LOOKUP_CONCURRENCY)
+
+        async def _search_one(session: aiohttp.ClientSession, key: tuple[str, str]) -> None:
+            nonlocal consecutive_failures
+            async with sem:
+                if consecutive_failures >= 5:
+                    return  # breaker open: leave uncached for the next run
+                url = await _lookup_dept(session, *key)
+                new_rows.append((*key, url))
+                consecutive_failures = 0 if url else consecutive_failures + 1
+
+        async with aiohttp.ClientSession(
+            headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"},
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as session:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*[_search_one(session, k) for k in keys]),
+                    timeout=ENRICHMENT_BUDGET_S,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Dept search budget expired: %d/%d searched", len(new_rows), len(keys),
+                )
+
+    _run_async(_search_all())
+    if consecutive_failures >= 5:
+        logger.warning(
+            "DDG circuit breaker after %d failures, deferred %d lookups",
+            consecutive_failures, len(keys) - len(new_rows),
         )
 
 
@@ -385,60 +669,30 @@ def run_dept_enrichment(jobs: list[dict]) -> list[dict]:
 
     def _make_key(job: dict) -> tuple[str, str]:
         return (
-            (job.get("institute") or "").strip().lower(),
-            (job.get("department") or job.get("field") or "").strip().lower(),
+            _norm_key_part(job.get("institute") or ""),
+            _norm_key_part(job.get("department") or job.get("field") or ""),
         )
 
-    def _lookup_dept(institute: str, dept_hint: str) -> str | None:
-        """Search DDG directly for '{institute} {dept_hint} department' (no site: operator)."""
-        import requests as _req
-        import re as _re
-        from src.discovery.lab_finder import _extract_ddg_url, _is_valid_lab_url, _institute_to_domain
-        import time as _time
-
-        domain = _institute_to_domain(institute)
-        query = f"{institute} {dept_hint} department".strip() if dept_hint else f"{institute} research department"
-        url = f"https://html.duckduckgo.com/html/?q={_req.utils.quote(query)}"
-        headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
-        try:
-            resp = _req.get(url, headers=headers, timeout=15)
-            if resp.status_code == 403:
-                logger.debug("DDG 403 for dept lookup: %s", institute)
-                return None
-            resp.raise_for_status()
-            _time.sleep(2.5)
-
-            urls = _re.findall(r'class="result__a"[^>]*href="([^"]+)"', resp.text)
-            for candidate in urls[:5]:
-                real = _extract_ddg_url(candidate)
-                if not real or not _is_valid_lab_url(real):
-                    continue
-                # Prefer results on the institute's own domain
-                if domain and domain in real:
-                    return real
-            # Fallback: return first valid result
-            for candidate in urls[:3]:
-                real = _extract_ddg_url(candidate)
-                if real and _is_valid_lab_url(real):
-                    return real
-        except Exception:
-            logger.debug("Dept DDG search failed for %s", institute)
-        return None
-
-    unique_keys = set(_make_key(j) for j in candidates)
+    keys = [_make_key(j) for j in candidates]
+    unique_keys = set(keys)
+    # Best match_score per key: the DDG search order under the time budget
+    best_score: dict[tuple[str, str], float] = {}
+    for job, key in zip(candidates, keys):
+        best_score[key] = max(best_score.get(key, 0), job.get("match_score") or 0)
     logger.info(
         "Dept URL enrichment: %d jobs, %d unique pairs", len(candidates), len(unique_keys),
     )
 
-    # Phase 1: fill from cache
+    # Phase 1: fill from cache (one read of the whole table)
+    cache = _load_dept_cache()
     key_to_url: dict[tuple, str | None] = {}
     uncached_keys: list[tuple[str, str]] = []
     for key in unique_keys:
-        found, url = _get_cached_dept(key[0], key[1])
-        if found:
-            key_to_url[key] = url
+        if key in cache:
+            key_to_url[key] = cache[key]
         else:
             uncached_keys.append(key)
+    uncached_keys.sort(key=lambda k: -best_score[k])
 
     logger.info(
         "Dept cache: %d hits, %d to search (max %d this run)",
@@ -448,151 +702,165 @@ def run_dept_enrichment(jobs: list[dict]) -> list[dict]:
     )
 
     # Phase 2: DDG search for uncached (with circuit breaker)
-    consecutive_failures = 0
-    searched = 0
-    # Sequential DDG lookups (DDG rate-limits parallel requests aggressively)
-    consecutive_failures = 0
-    for inst, dept in uncached_keys:
-        if consecutive_failures >= 5:
-            logger.warning("DDG circuit breaker after %d failures, deferring rest", consecutive_failures)
-            break
-
-        url = _lookup_dept(inst, dept)
-        _save_dept_cache(inst, dept, url)
-        key_to_url[(inst, dept)] = url
-        searched += 1
-
-        if url:
-            consecutive_failures = 0
-        else:
-            consecutive_failures += 1
+    if uncached_keys:
+        new_rows: list[tuple[str, str, str | None]] = []
+        try:
+            _search_dept_urls(uncached_keys, new_rows)
+        finally:
+            _save_dept_cache(new_rows)
+        key_to_url.update(((inst, hint), url) for inst, hint, url in new_rows)
+    else:
+        logger.info("Dept cache: every pair cached, skipping DDG search")
 
     # Phase 3: apply to jobs and persist to DB
-    from src.db import get_connection
     filled = 0
-    with get_connection() as conn:
-        for job in candidates:
-            key = _make_key(job)
-            url = key_to_url.get(key)
-            if url:
-                job["dept_url"] = url
-                filled += 1
-                # Persist to DB
-                job_url = job.get("url")
-                if job_url:
-                    conn.execute(
-                        "UPDATE jobs SET dept_url = ? WHERE url = ? AND (dept_url IS NULL OR dept_url = '')",
-                        (url, job_url),
-                    )
+    updates: list[tuple[str, str]] = []
+    for job, key in zip(candidates, keys):
+        url = key_to_url.get(key)
+        if url:
+            job["dept_url"] = url
+            filled += 1
+            if job.get("url"):
+                updates.append((url, job["url"]))
+    if updates:
+        with get_connection() as conn:
+            update_jobs_by_url(
+                conn,
+                {"dept_url": "v.dept_url"},
+                ("dept_url",),
+                updates,
+                where="(jobs.dept_url IS NULL OR jobs.dept_url = '')",
+            )
 
     logger.info("Dept URL enrichment complete: %d/%d filled", filled, len(candidates))
     return jobs
 
 
-def run_weekly_discovery(max_pi_lookup: int = 100) -> None:
-    """Run the weekly PI discovery pipeline."""
-    logger.info("Starting weekly PI discovery pipeline...")
+# Weekly discovery phases: (name, depends on, description, module, function).
+# Topic discovery skips PI names already in the DB, so it waits for every
+# phase that inserts PIs; lab lookup uses institutes filled in by enrichment.
+_WEEKLY_PHASES = (
+    ("seed", (), "Profiling seed PIs",
+     "src.discovery.seed_profiler", "profile_seed_pis"),
+    ("coauthor", ("seed",), "Building coauthor network",
+     "src.discovery.coauthor_network", "build_coauthor_network"),
+    # Citation waits for coauthor: both run their own S2 worker pools, and
+    # overlapping them would double the request rate against one API key.
+    ("citation", ("coauthor",), "Building citation network",
+     "src.discovery.citation_network", "build_citation_network"),
+    ("topic", ("coauthor", "citation"), "Topic-based discovery",
+     "src.discovery.topic_discovery", "discover_by_topic"),
+    ("score", ("topic",), "Scoring PI recommendations",
+     "src.discovery.pi_recommender", "score_all_pis"),
+    ("enrich", ("score",), "Enriching PI metadata (Semantic Scholar)",
+     "src.discovery.pi_enricher", "enrich_recommended_pis"),
+    ("lab", ("enrich",), "Finding lab URLs",
+     "src.discovery.lab_finder", "find_lab_urls"),
+)
 
-    try:
-        from src.discovery.seed_profiler import profile_seed_pis
-        logger.info("Phase 1: Profiling seed PIs...")
-        profile_seed_pis()
-    except Exception as e:
-        logger.error("Seed profiling failed: %s", e, exc_info=True)
 
+def _run_weekly_phase(phase: tuple, kwargs: dict) -> None:
+    """Run one discovery phase; a failure is logged and doesn't stop the rest."""
+    name, _, description, module, func = phase
     try:
-        from src.discovery.coauthor_network import build_coauthor_network
-        logger.info("Phase 2: Building coauthor network...")
-        build_coauthor_network()
-    except Exception as e:
-        logger.error("Coauthor network failed: %s", e, exc_info=True)
-
-    try:
-        from src.discovery.citation_network import build_citation_network
-        logger.info("Phase 3: Building citation network...")
-        build_citation_network()
+        number = _WEEKLY_PHASES.index(phase) + 1
+        if "max_pis" in kwargs:
+            logger.info("Phase %d: %s (max %d PIs)...", number, description, kwargs["max_pis"])
+        else:
+            logger.info("Phase %d: %s...", number, description)
+        result = getattr(importlib.import_module(module), func)(**kwargs)
+        if isinstance(result, dict):
+            logger.info("%s: %s", description, result)
     except Exception as e:
-        logger.error("Citation network failed: %s", e, exc_info=True)
+        logger.error("%s failed: %s", description, e, exc_info=True)
 
-    try:
-        from src.discovery.topic_discovery import discover_by_topic
-        logger.info("Phase 4: Topic-based discovery...")
-        discover_by_topic()
-    except Exception as e:
-        logger.error("Topic discovery failed: %s", e, exc_info=True)
 
-    try:
-        from src.discovery.pi_recommender import score_all_pis
-        logger.info("Phase 5: Scoring PI recommendations...")
-        score_all_pis()
-    except Exception as e:
-        logger.error("PI scoring failed: %s", e, exc_info=True)
+def run_weekly_discovery(max_pi_lookup: int = 100) -> None:
+    """Run the weekly PI discovery pipeline.
 
-    try:
-        from src.discovery.pi_enricher import enrich_recommended_pis
-        logger.info("Phase 6: Enriching PI metadata (Semantic Scholar)...")
-        result = enrich_recommended_pis(limit=200)
-        logger.info("PI enrichment: %s", result)
-    except Exception as e:
-        logger.error("PI enrichment failed: %s", e, exc_info=True)
+    Phases run one at a time, each after its dependencies in
+    ``_WEEKLY_PHASES`` have finished (successfully or not).
+    """
+    logger.info("Starting weekly PI discovery pipeline...")
+    phase_kwargs = {"enrich": {"limit": 200}, "lab": {"max_pis": max_pi_lookup}}
 
-    try:
-        from src.discovery.lab_finder import find_lab_urls
-        logger.info("Phase 7: Finding lab URLs (max %d PIs)...", max_pi_lookup)
-        find_lab_urls(max_pis=max_pi_lookup)
-    except Exception as e:
-        logger.error("Lab finder failed: %s", e, exc_info=True)
+    pending = list(_WEEKLY_PHASES)
+    finished: set[str] = set()
+    while pending:
+        phase = next(p for p in pending if finished.issuperset(p[1]))
+        pending.remove(phase)
+        _run_weekly_phase(phase, phase_kwargs.get(phase[0], {}))
+        finished.add(phase[0])
 
     logger.info("Weekly PI discovery pipeline complete")
 
 
-def run_report(send_email: bool = True) -> None:
-    """Generate and optionally send the report."""
+def _report_since() -> str:
+    """ISO timestamp 24 hours ago: the window for "new" jobs."""
+    return (datetime.now() - timedelta(hours=24)).isoformat()
+
+
+def run_report(
+    send_email: bool = True, excel_path: Path | None = None, since: str | None = None,
+) -> None:
+    """Generate and optionally send the report.
+
+    Pass *excel_path* when the workbook was already exported this run so it
+    is attached as-is rather than exported again, and *since* to share the
+    new-jobs window with ``print_summary``.
+    """
     from src.reporting.email_report import send_report
     from src.reporting.excel_export import export_to_excel
 
-    since = (datetime.now() - timedelta(hours=24)).isoformat()
+    if since is None:
+        since = _report_since()
 
     # Export Excel
-    try:
-        excel_path = export_to_excel()
-        logger.info("Excel exported to %s", excel_path)
-    except Exception as e:
-        logger.error("Excel export failed: %s", e, exc_info=True)
+    if excel_path is None:
+        try:
+            excel_path = export_to_excel()
+            logger.info("Excel exported to %s", excel_path)
+        except Exception as e:
+            logger.error("Excel export failed: %s", e, exc_info=True)
 
     # Send email
     if send_email:
         try:
-            send_report(since)
+            send_report(since, excel_path=excel_path)
         except Exception as e:
             logger.error("Email report failed: %s", e, exc_info=True)
 
 
-def print_summary(jobs: list[dict]) -> None:
+def print_summary(jobs: list[dict], since: str | None = None) -> None:
     """Print a text summary of results to console."""
-    from src.db import get_new_jobs_since
-
-    since = (datetime.now() - timedelta(hours=24)).isoformat()
+    if since is None:
+        since = _report_since()
     new_jobs = get_new_jobs_since(since)
 
-    us = [j for j in new_jobs if j.get("region") == "US"]
-    eu = [j for j in new_jobs if j.get("region") == "EU"]
-    korea = [j for j in new_jobs if j.get("region") == "Korea"]
-    asia = [j for j in new_jobs if j.get("region") == "Asia"]
-    other = [j for j in new_jobs if j.get("region") not in ("US", "EU", "Korea", "Asia")]
-
-    print(f"\n{'='*70}")
-    print(f" Job Search Pipeline Results — {datetime.now().strftime('%b %d, %Y')}")
-    print(f"{'='*70}")
-    print(f" Total scraped: {len(jobs)}")
-    print(f" New jobs (24h): {len(new_jobs)}")
-    print(f"   US: {len(us)}  |  EU: {len(eu)}  |  Korea: {len(korea)}  |  Asia: {len(asia)}  |  Other: {len(other)}")
-    print(f"{'='*70}")
-
-    for region_name, region_jobs in [("US", us), ("EU", eu), ("Korea", korea), ("Asia/Other", asia + other)]:
-        if region_jobs:
-            print(f"\n── {region_name} ({len(region_jobs)}) ──")
-            for i, j in enumerate(region_jobs[:10], 1):
+    buckets: dict[str, list[dict]] = {"US": [], "EU": [], "Korea": [], "Asia": [], "Other": []}
+    for j in new_jobs:
+        buckets.get(j.get("region"), buckets["Other"]).append(j)
+    us, eu, korea, asia, other = buckets.values()
+
+    # Built up and written once rather than one print() per line
+    lines: list[str] = []
+    lines.append(f"\n{'='*70}")
+    lines.append(f" Job Search Pipeline Results — {datetime.now().strftime('%b %d, %Y')}")
+    lines.append(f"{'='*70}")
+    lines.append(f" Total scraped: {len(jobs)}")
+    lines.append(f" New jobs (24h): {len(new_jobs)}")
+    lines.append(f"   US: {len(us)}  |  EU: {len(eu)}  |  Korea: {len(korea)}  |  Asia: {len(asia)}  |  Other: {len(other)}")
+    lines.append(f"{'='*70}")
+
+    # Asia and Other are listed together; chain them rather than concatenate
+    sections = [
+        ("US", len(us), us), ("EU", len(eu), eu), ("Korea", len(korea), korea),
+        ("Asia/Other", len(asia) + len(other), itertools.chain(asia, other)),
+    ]
+    for region_name, count, region_jobs in sections:
+        if count:
+            lines.append(f"\n── {region_name} ({count}) ──")
+            for i, j in enumerate(itertools.islice(region_jobs, 10), 1):
                 inst = j.get("institute") or "-"
                 tier = j.get("tier")
                 tier_str = f"T{tier}" if tier else ""
@@ -604,18 +872,19 @@ def print_summary(jobs: list[dict]) -> None:
                 conditions = j.get("conditions") or ""
                 score = j.get("match_score") or 0
                 score_str = f" | Score: {score:.0%}" if score else ""
-                print(f"  {i}. {title}")
-                print(f"     {inst} {tier_str} | {country} [{source}]{score_str}")
+                lines.append(f"  {i}. {title}")
+                lines.append(f"     {inst} {tier_str} | {country} [{source}]{score_str}")
                 if pi:
-                    print(f"     PI: {pi}")
+                    lines.append(f"     PI: {pi}")
                 if keywords:
-                    print(f"     Keywords: {keywords[:80]}")
+                    lines.append(f"     Keywords: {keywords[:80]}")
                 if conditions:
-                    print(f"     Conditions: {conditions[:80]}")
-            if len(region_jobs) > 10:
-                print(f"  ... and {len(region_jobs) - 10} more")
+                    lines.append(f"     Conditions: {conditions[:80]}")
+            if count > 10:
+                lines.append(f"  ... and {count - 10} more")
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 def main() -> None:
@@ -637,6 +906,9 @@ def main() -> None:
 
     setup_logging(args.verbose)
     init_db()
+    # Startup objects (modules, config, rankings) live for the whole run;
+    # keep them out of the cyclic GC's scans during the scraping burst
+    gc.freeze()
 
     if args.backfill_pi:
         from src.matching.backfill_pi_urls import backfill
@@ -665,7 +937,6 @@ def main() -> None:
             # and ALL existing jobs get re-scored.
             import time
             time.sleep(5)
-            from src.db import get_jobs
             all_db = get_jobs(limit=10000)
             scraped_urls = {j["url"] for j in jobs if j.get("url")}
             extra = [j for j in all_db if j.get("url") and j["url"] not in scraped_urls]
@@ -675,7 +946,6 @@ def main() -> None:
                 len(scraped_urls), len(extra), len(jobs),
             )
     else:
-        from src.db import get_jobs
         jobs = get_jobs(limit=10000)
         logger.info("Weekly PI mode: loaded %d existing jobs from DB (no scraping)", len(jobs))
 
@@ -694,6 +964,7 @@ def main() -> None:
     jobs = run_dept_enrichment(jobs)
 
     # ── Export (weekly without full-refresh → incremental to preserve edits) ──
+    excel_path = None
     try:
         from src.reporting.excel_export import export_to_excel
         excel_path = export_to_excel(full_refresh=args.full_refresh)
@@ -701,11 +972,13 @@ def main() -> None:
     except Exception as e:
         logger.error("Excel export failed: %s", e, exc_info=True)
 
+    # One window for both, so the summary and the email list the same jobs
+    since = _report_since()
     if args.summary:
-        print_summary(jobs)
+        print_summary(jobs, since=since)
 
     if not args.no_email:
-        run_report(send_email=True if args.email else False)
+        run_report(send_email=True if args.email else False, excel_path=excel_path, since=since)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,12 @@
 """Generate and send email reports with weekly trend statistics."""
 
+import functools
 import logging
+import mimetypes
 import smtplib
 from collections import Counter
 from datetime import datetime, timedelta
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email import encoders
+from email.message import EmailMessage
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
@@ -20,6 +19,13 @@ logger = logging.getLogger(__name__)
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
 
+@functools.cache
+def _get_report_template():
+    """Load and compile ``report.html`` once per process."""
+    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), auto_reload=False)
+    return env.get_template("report.html")
+
+
 def _compute_weekly_trends() -> dict:
     """Compute weekly trend statistics from the database.
 
@@ -37,20 +43,16 @@ def _compute_weekly_trends() -> dict:
     last_week_end = (now - timedelta(days=7)).strftime("%Y-%m-%d")
 
     with get_connection() as conn:
-        # This week count
-        row = conn.execute(
-            "SELECT COUNT(*) AS cnt FROM jobs WHERE discovered_at >= ?",
-            (this_week_start,),
-        ).fetchone()
-        this_week = row["cnt"] if row else 0
-
-        # Last week count
+        # This/last week job counts and new PIs in one statement
         row = conn.execute(
-            "SELECT COUNT(*) AS cnt FROM jobs "
-            "WHERE discovered_at >= ? AND discovered_at < ?",
-            (last_week_start, last_week_end),
+            "SELECT "
+            "  COALESCE(SUM(discovered_at >= ?), 0) AS this_week, "
+            "  COALESCE(SUM(discovered_at >= ? AND discovered_at < ?), 0) AS last_week, "
+            "  (SELECT COUNT(*) FROM pis WHERE created_at >= ?) AS new_pis "
+            "FROM jobs WHERE discovered_at >= ?",
+            (this_week_start, last_week_start, last_week_end, this_week_start, last_week_start),
         ).fetchone()
-        last_week = row["cnt"] if row else 0
+        this_week, last_week, new_pis = row["this_week"], row["last_week"], row["new_pis"]
 
         # Top fields this week
         rows = conn.execute(
@@ -70,13 +72,6 @@ def _compute_weekly_trends() -> dict:
         ).fetchall()
         top_countries = [(r["country"], r["cnt"]) for r in rows]
 
-        # New PIs this week
-        row = conn.execute(
-            "SELECT COUNT(*) AS cnt FROM pis WHERE created_at >= ?",
-            (this_week_start,),
-        ).fetchone()
-        new_pis = row["cnt"] if row else 0
-
     change_pct = 0.0
     if last_week > 0:
         change_pct = ((this_week - last_week) / last_week) * 100
@@ -136,17 +131,15 @@ def render_report(jobs: list[dict], recommendations: list[dict] = None) -> str:
     Includes weekly trend statistics and summary dashboard.
     Enriches job data to fill missing institute/country/tier info.
     """
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
-    template = env.get_template("report.html")
+    template = _get_report_template()
 
     # Enrich jobs to fill missing info for display
     jobs = [_enrich_job_for_email(j) for j in jobs]
 
-    us_jobs = [j for j in jobs if j.get("region") == "US"]
-    eu_jobs = [j for j in jobs if j.get("region") == "EU"]
-    korea_jobs = [j for j in jobs if j.get("region") == "Korea"]
-    asia_jobs = [j for j in jobs if j.get("region") == "Asia"]
-    other_jobs = [j for j in jobs if j.get("region") not in ("US", "EU", "Korea", "Asia")]
+    buckets: dict[str, list[dict]] = {"US": [], "EU": [], "Korea": [], "Asia": [], "Other": []}
+    for j in jobs:
+        buckets.get(j.get("region"), buckets["Other"]).append(j)
+    us_jobs, eu_jobs, korea_jobs, asia_jobs, other_jobs = buckets.values()
 
     trends = _compute_weekly_trends()
 
@@ -173,10 +166,11 @@ def render_report(jobs: list[dict], recommendations: list[dict] = None) -> str:
 def build_subject(jobs: list[dict], recommendations: list[dict] = None) -> str:
     """Build email subject line."""
     date_str = datetime.now().strftime("%b %d")
-    us = sum(1 for j in jobs if j.get("region") == "US")
-    eu = sum(1 for j in jobs if j.get("region") == "EU")
-    korea = sum(1 for j in jobs if j.get("region") == "Korea")
-    asia = sum(1 for j in jobs if j.get("region") in ("Asia", "Other"))
+    region_counts = Counter(j.get("region") for j in jobs)
+    us = region_counts["US"]
+    eu = region_counts["EU"]
+    korea = region_counts["Korea"]
+    asia = region_counts["Asia"] + region_counts["Other"]
 
     parts = []
     if us:
@@ -226,30 +220,26 @@ def send_email(
         logger.error("No recipients configured")
         return False
 
-    msg = MIMEMultipart("mixed")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = GMAIL_ADDRESS
     msg["To"] = ", ".join(recipients)
+    msg.set_content(html_body, subtype="html")
 
-    # HTML body as an alternative sub-part
-    html_part = MIMEText(html_body, "html")
-    msg.attach(html_part)
-
-    # Attach files
+    # Attach files (turns the message into multipart/mixed)
     for filepath in (attachments or []):
         if not filepath.exists():
             logger.warning("Attachment not found, skipping: %s", filepath)
             continue
         try:
-            part = MIMEBase("application", "octet-stream")
-            with open(filepath, "rb") as f:
-                part.set_payload(f.read())
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                f"attachment; filename={filepath.name}",
+            ctype, _ = mimetypes.guess_type(filepath.name)
+            maintype, subtype = (ctype or "application/octet-stream").split("/", 1)
+            msg.add_attachment(
+                filepath.read_bytes(),
+                maintype=maintype,
+                subtype=subtype,
+                filename=filepath.name,
             )
-            msg.attach(part)
             logger.info("Attached file: %s", filepath.name)
         except Exception:
             logger.exception("Failed to attach file: %s", filepath)
@@ -257,7 +247,7 @@ def send_email(
     try:
         with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
             server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-            server.sendmail(GMAIL_ADDRESS, recipients, msg.as_string())
+            server.send_message(msg, from_addr=GMAIL_ADDRESS, to_addrs=recipients)
         logger.info("Email sent to %s", ", ".join(recipients))
         return True
     except smtplib.SMTPException as e:
@@ -330,6 +320,7 @@ def send_report(
     since: str,
     include_recommendations: bool = True,
     attach_excel: bool = True,
+    excel_path: Path | None = None,
 ) -> bool:
     """Generate and send the full report with optional Excel attachment.
 
@@ -345,6 +336,9 @@ def send_report(
         Whether to include PI recommendation section.
     attach_excel : bool
         Whether to generate and attach an Excel export file.
+    excel_path : Path, optional
+        Workbook already exported this run; attached as-is instead of
+        generating another one.
     """
     raw_jobs = get_new_jobs_since(since)
     if not raw_jobs:
@@ -362,7 +356,9 @@ def send_report(
     subject = build_subject(jobs, recommendations)
 
     attachments: list[Path] = []
-    if attach_excel:
+    if attach_excel and excel_path:
+        attachments.append(excel_path)
+    elif attach_excel:
         try:
             from src.reporting.excel_export import export_to_excel
             excel_path = export_to_excel()
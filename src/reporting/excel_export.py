@@ -756,9 +756,14 @@ def _style_worksheet(writer: pd.ExcelWriter, sheet_name: str, df: pd.DataFrame)
         else:
             worksheet.set_column(i, i, width, default_fmt)
 
-    for row_idx, row in enumerate(df.to_dict("records"), start=1):
-        row_height = _estimate_row_height(row, width_map) or _DEFAULT_DATA_ROW_HEIGHT
-        worksheet.set_row(row_idx, row_height)
+    # Row heights only depend on the wrapped columns; skip converting the rest
+    wrapped_cols = [c for c in df.columns if c in _WRAPPED_TEXT_COLUMNS]
+    wrapped_rows = df[wrapped_cols].to_dict("records") if wrapped_cols else None
+    for row_idx in range(len(df)):
+        row_height = _DEFAULT_DATA_ROW_HEIGHT
+        if wrapped_rows is not None:
+            row_height = _estimate_row_height(wrapped_rows[row_idx], width_map) or row_height
+        worksheet.set_row(row_idx + 1, row_height)
 
     # Auto-filter on all columns
     if len(df) > 0:
@@ -2720,10 +2725,10 @@ def export_to_excel(output_dir: Path = None, full_refresh: bool = False) -> Path
                     len(raw_jobs), len(all_jobs), excluded_count, len(all_dismissed))
 
     # Phase 4: Split by region and sort
-    us_jobs = _sort_by_tier([j for j in all_jobs if j.get("region") == "US"])
-    eu_jobs = _sort_by_tier([j for j in all_jobs if j.get("region") == "EU"])
-    korea_jobs = _sort_by_tier([j for j in all_jobs if j.get("region") == "Korea"])
-    other_jobs = _sort_by_tier([j for j in all_jobs if j.get("region") not in ("US", "EU", "Korea")])
+    buckets: dict[str, list[dict]] = {"US": [], "EU": [], "Korea": [], "Other": []}
+    for j in all_jobs:
+        buckets.get(j.get("region"), buckets["Other"]).append(j)
+    us_jobs, eu_jobs, korea_jobs, other_jobs = (_sort_by_tier(b) for b in buckets.values())
 
     rec_pis = _sort_pis_by_tier(get_recommended_pis())
 
@@ -181,6 +181,7 @@ class _AsyncSessionManager:
                 connector = aiohttp.TCPConnector(
                     limit=30,
                     limit_per_host=6,
+                    ttl_dns_cache=300,  # scrapers hit the same few hosts all run
                     enable_cleanup_closed=True,
                 )
                 cls._session = aiohttp.ClientSession(
@@ -194,6 +195,7 @@ class _AsyncSessionManager:
         if cls._session and not cls._session.closed:
             await cls._session.close()
             cls._session = None
+        cls._lock = None  # bound to this run's event loop
 
 
 _SENTENCE_ENDERS = frozenset(".!?;:)\"'")
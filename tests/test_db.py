@@ -10,9 +10,11 @@ from src.db import (
     init_db,
     get_connection,
     upsert_job,
+    update_jobs_by_url,
     get_jobs,
     get_new_jobs_since,
     upsert_pi,
+    upsert_pis_bulk,
     get_seed_pis,
     get_recommended_pis,
     get_all_pis,
@@ -55,6 +57,10 @@ class TestInitDb:
                 assert "idx_jobs_region" in index_names
                 assert "idx_jobs_status" in index_names
                 assert "idx_pis_name" in index_names
+                assert "idx_jobs_discovered_field" in index_names
+                assert "idx_jobs_discovered_country" in index_names
+                assert "idx_jobs_discovered_at" not in index_names
+                assert "idx_pis_created_at" in index_names
 
     def test_idempotent(self, test_db):
         """Calling init_db twice should not raise errors."""
@@ -216,6 +222,65 @@ class TestGetJobs:
             assert len(jobs) >= 1
 
 
+class TestUpdateJobsByUrl:
+    @pytest.fixture(params=[True, False], ids=["update_from", "subquery"])
+    def db(self, request, test_db):
+        """Run each test against both the UPDATE ... FROM and the pre-3.33 path."""
+        with patch("src.db.DB_PATH", test_db), patch("src.db._HAS_UPDATE_FROM", request.param):
+            yield test_db
+
+    def test_chunked_update_with_where(self, db):
+        for i in range(600):
+            upsert_job({"title": f"Job {i}", "url": f"https://ex.com/{i}", "source": "t"})
+        upsert_job({"title": "Applied", "url": "https://ex.com/x", "status": "applied", "source": "t"})
+        rows = [(0.5, None, f"https://ex.com/{i}") for i in range(600)]
+        rows.append((0.9, "EU", "https://ex.com/0"))  # later row wins
+        with get_connection() as conn:
+            update_jobs_by_url(
+                conn,
+                {"match_score": "v.score", "region": "COALESCE(v.region, jobs.region)"},
+                ("score", "region"),
+                rows,
+            )
+            update_jobs_by_url(
+                conn, {"status": "'merged'"}, (),
+                [("https://ex.com/1",), ("https://ex.com/x",)],
+                where="jobs.status = 'new'",
+            )
+        jobs = {j["url"]: j for j in get_jobs(limit=1000)}
+        assert jobs["https://ex.com/0"]["match_score"] == 0.9
+        assert jobs["https://ex.com/0"]["region"] == "EU"
+        assert jobs["https://ex.com/599"]["match_score"] == 0.5
+        assert jobs["https://ex.com/1"]["status"] == "merged"
+        assert jobs["https://ex.com/x"]["status"] == "applied"
+
+    def test_where_guard_reads_row_values(self, db):
+        upsert_job({"title": "A", "url": "https://ex.com/a", "region": "US", "source": "t"})
+        upsert_job({"title": "B", "url": "https://ex.com/b", "pi_name": "Kept", "source": "t"})
+        upsert_job({"title": "C", "url": "https://ex.com/c", "source": "t"})
+        with get_connection() as conn:
+            update_jobs_by_url(
+                conn, {"pi_name": "v.pi_name"}, ("pi_name",),
+                [("New", "https://ex.com/a"), ("New", "https://ex.com/b"), ("", "https://ex.com/c")],
+                where="(jobs.pi_name IS NULL OR jobs.pi_name = '') AND v.pi_name != ''",
+            )
+        jobs = {j["url"]: j for j in get_jobs()}
+        assert jobs["https://ex.com/a"]["pi_name"] == "New"
+        assert jobs["https://ex.com/b"]["pi_name"] == "Kept"
+        assert jobs["https://ex.com/c"]["pi_name"] in (None, "")
+        assert jobs["https://ex.com/a"]["region"] == "US"
+
+    def test_repeated_url_under_guard_uses_last_row(self, db):
+        upsert_job({"title": "A", "url": "https://ex.com/a", "source": "t"})
+        with get_connection() as conn:
+            update_jobs_by_url(
+                conn, {"alt_url": "v.alt_url"}, ("alt_url",),
+                [("https://first", "https://ex.com/a"), ("https://last", "https://ex.com/a")],
+                where="(jobs.alt_url IS NULL OR jobs.alt_url = '')",
+            )
+        assert get_jobs()[0]["alt_url"] == "https://last"
+
+
 # ===== PI CRUD =====
 
 class TestUpsertPi:
@@ -249,6 +314,50 @@ class TestUpsertPi:
             pis = get_all_pis()
             assert len(pis) == 2
 
+    def test_concurrent_upserts_insert_once(self, test_db):
+        """Concurrent upserts of one PI must not race on UNIQUE(name, institute)."""
+        with patch("src.db.DB_PATH", test_db):
+            errors = []
+            new_flags = []
+
+            def upsert(idx):
+                try:
+                    _, is_new = upsert_pi({"name": "John Smith", "institute": "MIT", "h_index": idx})
+                    new_flags.append(is_new)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=upsert, args=(i,)) for i in range(20)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(errors) == 0, f"Thread errors: {errors}"
+            assert new_flags.count(True) == 1
+            assert len(get_all_pis()) == 1
+
+
+class TestUpsertPisBulk:
+    def test_inserts_and_merges(self, test_db):
+        with patch("src.db.DB_PATH", test_db):
+            upsert_pi({"name": "John Smith", "institute": "MIT", "h_index": 50, "lab_url": "https://lab"})
+            count = upsert_pis_bulk([
+                {"name": "John Smith", "institute": "MIT", "h_index": 55},
+                {"name": "Jane Doe", "institute": "Stanford", "scholar_url": "https://gs"},
+            ])
+            assert count == 2
+
+            pis = {p["name"]: p for p in get_all_pis()}
+            assert len(pis) == 2
+            assert pis["John Smith"]["h_index"] == 55
+            assert pis["John Smith"]["lab_url"] == "https://lab"  # None doesn't clobber
+            assert pis["Jane Doe"]["scholar_url"] == "https://gs"
+
+    def test_empty(self, test_db):
+        with patch("src.db.DB_PATH", test_db):
+            assert upsert_pis_bulk([]) == 0
+
 
 class TestGetPis:
     def test_get_seed_pis(self, test_db):
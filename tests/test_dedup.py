@@ -313,3 +313,19 @@ class TestDeduplicateJobs:
         assert len(result) == 3
         assert result[0]["url"] == "https://unique.com/1"
         assert result[2]["url"] == "https://unique.com/2"
+
+    def test_return_losers(self):
+        """Loser URLs match the set difference between input and kept URLs."""
+        jobs = [
+            {"url": "https://dup.com/1", "title": "Postdoc SynBio", "institute": "MIT", "description": "Short"},
+            {"url": "https://unique.com/1", "title": "Job A", "institute": "Harvard", "description": ""},
+            {"url": "https://dup.com/2", "title": "Postdoc SynBio", "institute": "MIT", "description": "Longer text here"},
+            {"url": "https://dup.com/2", "title": "Postdoc SynBio", "institute": "MIT", "description": "Tiny"},
+        ]
+        result, losers = deduplicate_jobs(jobs, return_losers=True)
+        assert losers == {"https://dup.com/1"}
+        kept = {j["url"] for j in result}
+        assert losers == {j["url"] for j in jobs} - kept
+
+    def test_return_losers_empty(self):
+        assert deduplicate_jobs([], return_losers=True) == ([], set())
@@ -0,0 +1,147 @@
+"""Tests for src/matching/pi_lookup.py — PI URL cache and fallback chain."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.db import get_connection, upsert_pi
+from src.matching import pi_lookup
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    pi_lookup.clear_pi_lookup_cache()
+    pi_lookup._S2_PREFETCHED.clear()
+    yield
+    pi_lookup.clear_pi_lookup_cache()
+    pi_lookup._S2_PREFETCHED.clear()
+
+
+@pytest.fixture
+def no_external():
+    """Patch every external lookup used by lookup_pi_urls to return nothing."""
+    with patch.object(pi_lookup, "search_scholar_author", return_value=None) as gs, \
+         patch.object(pi_lookup, "find_lab_url_multi_strategy", return_value=None) as lab, \
+         patch.object(pi_lookup, "fetch_semantic_scholar_metadata", return_value=None) as s2, \
+         patch.object(pi_lookup, "fetch_pi_papers", return_value=None) as papers, \
+         patch.object(pi_lookup, "_lookup_dept_url", return_value=None) as dept, \
+         patch.object(pi_lookup.time, "sleep"):
+        yield {"scholar": gs, "lab": lab, "s2": s2, "papers": papers, "dept": dept}
+
+
+class TestNegativeCache:
+    def test_records_attempted_sources(self, test_db, no_external):
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT last_try_scholar, last_try_lab, last_try_s2, last_try_dept"
+                " FROM pis WHERE name = ?",
+                ("Jane Doe",),
+            ).fetchone()
+        assert row["last_try_scholar"]
+        assert row["last_try_lab"]
+        assert row["last_try_s2"]
+        assert row["last_try_dept"]
+
+    def test_all_sources_recently_missed_makes_no_calls(self, test_db, no_external):
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        pi_lookup.clear_pi_lookup_cache()
+        for mock in no_external.values():
+            mock.reset_mock()
+
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        for mock in no_external.values():
+            mock.assert_not_called()
+
+    def test_recent_miss_skips_only_that_source(self, test_db, no_external):
+        recent = datetime.now().isoformat()
+        upsert_pi({
+            "name": "Jane Doe", "institute": "MIT",
+            "scholar_url": "https://scholar.example/jd",
+            "last_try_lab": recent,
+        })
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        no_external["scholar"].assert_not_called()  # cached hit
+        no_external["lab"].assert_not_called()      # recent miss
+        no_external["s2"].assert_called_once()      # never tried
+        no_external["dept"].assert_called_once()    # never tried
+
+    def test_blocked_search_is_not_recorded(self, test_db, no_external):
+        from src.discovery import scholar_scraper, web_search
+
+        def blocked_scholar(*args, **kwargs):
+            scholar_scraper._gs_blocked.count = scholar_scraper.gs_blocked_count() + 1
+            return None
+
+        def blocked_lab(*args, **kwargs):
+            web_search.note_ddg_blocked()
+            return None
+
+        no_external["scholar"].side_effect = blocked_scholar
+        no_external["lab"].side_effect = blocked_lab
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT last_try_scholar, last_try_lab, last_try_dept"
+                " FROM pis WHERE name = ?",
+                ("Jane Doe",),
+            ).fetchone()
+        assert row["last_try_scholar"] is None
+        assert row["last_try_lab"] is None
+        assert row["last_try_dept"]
+
+    def test_rate_limited_s2_is_not_recorded(self, test_db, no_external):
+        from src.discovery import seed_profiler
+
+        def rate_limited(*args, **kwargs):
+            seed_profiler._note_s2_blocked()
+            return None
+
+        no_external["s2"].side_effect = rate_limited
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT")
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT last_try_s2 FROM pis WHERE name = ?", ("Jane Doe",),
+            ).fetchone()
+        assert row["last_try_s2"] is None
+
+    def test_stale_miss_is_retried(self, test_db, no_external):
+        stale = (datetime.now() - timedelta(days=30)).isoformat()
+        upsert_pi({
+            "name": "Jane Doe", "institute": "MIT",
+            "scholar_url": "https://scholar.example/jd",
+            "last_try_lab": stale,
+        })
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT")
+        no_external["lab"].assert_called_once()
+
+
+class TestMemo:
+    def test_repeat_lookup_is_memoized(self, test_db, no_external):
+        first = pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        first["lab_url"] = "mutated by caller"
+        second = pi_lookup.lookup_pi_urls("Jane Doe", "MIT", "Biology")
+        no_external["scholar"].assert_called_once()
+        assert second["lab_url"] is None
+
+    def test_cache_row_buffered_once(self, test_db, no_external):
+        pending: list[dict] = []
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", pending_writes=pending)
+        pi_lookup.lookup_pi_urls("Jane Doe", "MIT", pending_writes=pending)
+        assert [r["name"] for r in pending] == ["Jane Doe"]
+
+
+class TestS2Prefetch:
+    def test_prefetched_metadata_skips_search(self, test_db, no_external):
+        upsert_pi({"name": "Jane Doe", "institute": "MIT", "s2_author_id": "42"})
+        batch = {"42": {"h_index": 30, "citations": 900, "authorId": "42"}}
+        with patch.object(pi_lookup, "fetch_semantic_scholar_metadata_batch",
+                          return_value=batch) as fetch_batch:
+            assert pi_lookup.prefetch_s2_metadata([("Jane Doe", "MIT"), ("John Roe", "MIT")]) == 1
+        fetch_batch.assert_called_once_with(["42"])
+
+        result = pi_lookup.lookup_pi_urls("Jane Doe", "MIT")
+        no_external["s2"].assert_not_called()
+        assert result["h_index"] == 30
+        assert result["citations"] == 900
@@ -60,6 +60,15 @@ class TestKeywordMatchScore:
         keywords = ["synthetic biology", "CRISPR"]
         assert keyword_match_score(text, keywords) == 1.0
 
+    def test_overlapping_keywords_all_counted(self):
+        text = "crispr-cas9 protein engineering"
+        keywords = ["crispr", "cas9", "protein", "protein engineering"]
+        assert keyword_match_score(text, keywords) == 1.0
+
+    def test_korean_synonym_match(self):
+        text = "합성생물학 연구실 박사후연구원 모집"
+        assert keyword_match_score(text, ["synthetic biology", "CRISPR"]) == 0.5
+
 
 # ===== get_institution_tier =====
 
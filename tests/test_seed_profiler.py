@@ -0,0 +1,38 @@
+"""Tests for src/discovery/seed_profiler.py — Semantic Scholar helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.discovery import seed_profiler
+
+
+def _response(status: int, payload=None) -> MagicMock:
+    resp = MagicMock(status_code=status)
+    resp.json.return_value = payload
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch.object(seed_profiler.time, "sleep") as sleep:
+        yield sleep
+
+
+class TestMetadataBatch:
+    def test_rate_limited_batch_is_retried_once(self, no_sleep):
+        ok = _response(200, [{"authorId": "42", "name": "Jane Doe", "hIndex": 30}])
+        with patch.object(seed_profiler.S2_SESSION, "post",
+                          side_effect=[_response(429), ok]) as post:
+            result = seed_profiler.fetch_semantic_scholar_metadata_batch(["42"])
+        assert post.call_count == 2
+        assert result["42"]["h_index"] == 30
+        no_sleep.assert_any_call(seed_profiler._S2_BATCH_BACKOFF)
+
+    def test_batch_dropped_after_second_rate_limit(self, caplog):
+        with patch.object(seed_profiler.S2_SESSION, "post",
+                          return_value=_response(429)) as post:
+            result = seed_profiler.fetch_semantic_scholar_metadata_batch(["1", "2"])
+        assert post.call_count == 2
+        assert result == {}
+        assert "dropping author batch of 2 ids" in caplog.text